@@ -2,6 +2,27 @@
 
 from HybridCloud.dependencies import *
 from abc import ABC, abstractmethod
+import heapq
+
+# Number of feasible heap entries inspected when choosing the best-fit device
+BEST_FIT_SCAN = 4
+
+# Stand-in logger for record managers that do not expose log_job_event
+_NOOP = lambda *args, **kwargs: None
+
+# Record keys per phase: (start, finish, arrive, wait_{iter}, svc_{iter}, turn_{iter})
+_QPU_KEYS = ("qpu_start", "qpu_finish", "qpu_arrive", "qpu_wait_{0}", "qpu_svc_{0}", "qpu_turn_{0}")
+_CPU_KEYS = ("cpu_start", "cpu_finish", "cpu_arrive", "cpu_wait_{0}", "cpu_svc_{0}", "cpu_turn_{0}")
+_PHASE_KEYS = {"QPU": _QPU_KEYS, "qpu": _QPU_KEYS, "CPU": _CPU_KEYS, "cpu": _CPU_KEYS}
+
+# Shared read-only stand-in for a job without records yet
+_EMPTY = {}
+
+def _latest(value):
+    """
+    Most recent stamp of an event; repeated events are stored as lists.
+    """
+    return value[-1] if isinstance(value, list) else value
 
 class BaseBroker(ABC):
     def __init__(self, env, job, devices, job_records_manager):
@@ -12,6 +33,9 @@ class BaseBroker(ABC):
         self.job = job
         self.devices = devices
         self.job_records_manager = job_records_manager
+        self.log_event = (job_records_manager.log_job_event
+                          if hasattr(job_records_manager, "log_job_event") else _NOOP)
+        self._get_records = getattr(job_records_manager, "get_job_records", None)
 
     @abstractmethod
     def assign_device(self):
@@ -43,19 +67,22 @@ class SerialBroker(BaseBroker):
         - qcloud: Reference to the QCloud instance for job allocation.
         """
         self.qcloud = qcloud
-        self.log_event = (job_records_manager.log_job_event
-                          if hasattr(job_records_manager, "log_job_event") else None)
         self.printlog = printlog
         
     def assign_device(self):
         """
-        Assign a job to a random available device.
+        Assign a job to a random device that is not under maintenance.
         """
-        device = random.choice(self.devices)
-        while device.maint_lock:
-            print(f'{self.env.now:.2f}: Job {self.job.job_id} waiting. {device.name} under maintenance...')
-            yield self.env.timeout(1)
-        return device
+        free = [d for d in self.devices if not d.maint_lock]
+        while not free:
+            if self.printlog:
+                print(f'{self.env.now:.2f}: Job {self.job.job_id} waiting. All devices under maintenance...')
+            # Maintenance ending fires the device's release_event
+            yield self.env.any_of([d.release_event for d in self.devices])
+            free = [d for d in self.devices if not d.maint_lock]
+
+        rng = getattr(self.env, "rng", None)
+        return free[rng.integers(len(free))] if rng is not None else random.choice(free)
 
     def run(self):
         """
@@ -75,9 +102,18 @@ class ParallelBroker(BaseBroker):
     def __init__(self, env, job, devices, job_records_manager, qcloud, printlog=False):
         super().__init__(env, job, devices, job_records_manager)
         self.qcloud = qcloud
-        self.log_event = (job_records_manager.log_job_event
-                          if hasattr(job_records_manager, "log_job_event") else None)
         self.printlog = printlog
+        # Per-type device lists, split once by the cloud when it knows them
+        self.qpu_devices = getattr(qcloud, "qpus", None)
+        self.cpu_devices = getattr(qcloud, "cpus", None)
+        if self.qpu_devices is None or self.cpu_devices is None:
+            self.qpu_devices = [d for d in devices if getattr(d, "type", None) == "QPU"]
+            self.cpu_devices = [d for d in devices if getattr(d, "type", None) == "CPU"]
+        # Per-type capacity heaps maintained by the simulation environment
+        self.device_heaps = {
+            "CPU": getattr(env, "cpu_heap", None),
+            "QPU": getattr(env, "qpu_heap", None),
+        }
          
     # implement abstract method
     def assign_device(self, *args, **kwargs):
@@ -87,75 +123,118 @@ class ParallelBroker(BaseBroker):
     
     def _phase_start(self, job, phase, device):
         job.phase = phase
-        if self.log_event:
-            self.log_event(job.job_id, f"{phase.lower()}_start", round(self.env.now, 4))
+        self.log_event(job.job_id, _PHASE_KEYS[phase][0], self.env.now)
         # print(f"{self.env.now:.2f}: Job {job.job_id} PHASE START: {phase} on {device.name}")
 
     def _phase_end(self, job, phase, device):
-        if self.log_event:
-            self.log_event(job.job_id, f"{phase.lower()}_finish", round(self.env.now, 4))
+        self.log_event(job.job_id, _PHASE_KEYS[phase][1], self.env.now)
         # print(f"{self.env.now:.2f}: Job {job.job_id} PHASE END:   {phase} on {device.name}")
 
     def _required_units(self, phase, job):
         if phase == "QPU":
-            return max(1, getattr(job, "num_qubits", 1))
+            return max(1, job.num_qubits)
         # CPU requires a tuple (cpu_units, mem_bw)
         return self._cpu_needs(job)
 
     def _fits_physical(self, device, job):
-        req = getattr(job, "num_qubits", 1)
-        return hasattr(device, "number_of_qubits") and device.number_of_qubits >= req
+        return device.number_of_qubits >= job.num_qubits
 
     
     def _cpu_needs(self, job):
-        cpu_units = int(getattr(job, "cpu_units", 8))
-        mem_bw    = int(getattr(job, "mem_bw", 20))
-        return cpu_units, mem_bw
+        return job.cpu_units, job.mem_bw
     
     def _pick_device_by_capacity(self, device_type, needed):
         """
         For QPU: 'needed' is qubits.
         For CPU: 'needed' is a tuple (cpu_units, mem_bw).
         """
+        heap = self.device_heaps.get(device_type)
+        if heap is None:
+            return self._scan_device_by_capacity(device_type, needed)
+        return self._pop_best_fit(heap, device_type, needed)
+
+    def _feasible(self, device, device_type, needed):
+        if device.maint_lock:
+            return False
         if device_type == "CPU":
             need_cpu, need_bw = needed
-            candidates = [
-                d for d in self.devices
-                if getattr(d, "type", None) == "CPU"
-                and not getattr(d, "maint_lock", False)
-                and getattr(getattr(d, "container", None), "level", 0) >= need_cpu
-                and getattr(getattr(d, "mem_bw",    None), "level", 0) >= need_bw
-            ]
-        else:
-            # QPU path unchanged, but keep your _fits_physical check
-            candidates = [
-                d for d in self.devices
-                if getattr(d, "type", None) == "QPU"
-                and not getattr(d, "maint_lock", False)
-                and getattr(getattr(d, "container", None), "level", 0) >= needed
-                and self._fits_physical(d, self.job)
-            ]
-
-        if candidates:
-            # choose the most free device to reduce blocking
-            if device_type == "CPU":
-                candidates.sort(key=lambda d: (d.container.level, d.mem_bw.level), reverse=True)
-            else:
-                candidates.sort(key=lambda d: d.container.level, reverse=True)
-            return candidates[0]
-        return None
+            return device.container.level >= need_cpu and device.mem_bw.level >= need_bw
+        # Free qubits alone are not enough: process_job needs them as one connected subgraph
+        return (device.container.level >= needed and self._fits_physical(device, self.job)
+                and select_vertices_fast(device, needed, self.job.job_id) is not None)
+
+    def _pop_best_fit(self, heap, device_type, needed):
+        """
+        Best-Fit pick over a heap of (-free_units, idx, device) entries.
+
+        Entries are popped most-free first; stale keys are re-keyed on the fly and
+        duplicates left behind by capacity refreshes are dropped. Among the first
+        BEST_FIT_SCAN feasible devices, the one with the least leftover capacity wins.
+        """
+        need_units = needed[0] if device_type == "CPU" else needed
+        kept, seen = [], set()
+        best, best_slack, feasible = None, None, 0
+
+        while heap and feasible < BEST_FIT_SCAN:
+            neg_free, idx, device = heapq.heappop(heap)
+            if idx in seen:
+                continue
+            free = device.container.level
+            if -neg_free != free:
+                heapq.heappush(heap, (-free, idx, device))
+                continue
+            seen.add(idx)
+            kept.append((neg_free, idx, device))
+            if free < need_units:
+                break  # every remaining device has less free capacity
+            if self._feasible(device, device_type, needed):
+                feasible += 1
+                slack = free - need_units
+                if best is None or slack < best_slack:
+                    best, best_slack = device, slack
+
+        for entry in kept:
+            heapq.heappush(heap, entry)
+        return best
+
+    def _scan_device_by_capacity(self, device_type, needed):
+        """
+        Linear fallback used when the environment does not maintain device heaps.
+        Applies the same Best-Fit rule as _pop_best_fit: devices are taken most-free first,
+        and the least leftover capacity wins among the first BEST_FIT_SCAN feasible ones.
+        """
+        need_units = needed[0] if device_type == "CPU" else needed
+        devices = self.cpu_devices if device_type == "CPU" else self.qpu_devices
+        best, best_slack, feasible = None, None, 0
+        # sorted() is stable, so equally free devices keep their order, as heap ids do
+        for device in sorted(devices, key=lambda d: -d.container.level):
+            if feasible >= BEST_FIT_SCAN or device.container.level < need_units:
+                break
+            if self._feasible(device, device_type, needed):
+                feasible += 1
+                slack = device.container.level - need_units
+                if best is None or slack < best_slack:
+                    best, best_slack = device, slack
+        return best
+
+    def _capacity_released(self, device_type):
+        """
+        Event that fires when a device of 'device_type' frees capacity.
+        Falls back to a 0.5 time-unit poll when the cloud does not publish one.
+        """
+        capacity_event = getattr(self.qcloud, "capacity_event", None)
+        if capacity_event is None:
+            return self.env.timeout(0.5)
+        return capacity_event[device_type]
 
     def _record_phase_metrics(self, job, phase, iter_idx):
-        # pull stamps
-        recs = getattr(self.job_records_manager, "records", {})
-        row = recs.get(job.job_id, {})
-        start_key  = f"{phase}_start"
-        finish_key = f"{phase}_finish"
-        arrive_key = f"{phase}_arrive"
+        # pull stamps (latest iteration)
+        row = self._rec(job.job_id)
+        start_key, finish_key, arrive_key, wait_key, svc_key, turn_key = _PHASE_KEYS[phase]
 
-        t_arr = row.get(arrive_key)
-        t_s   = row.get(start_key)
-        t_f   = row.get(finish_key)
+        t_arr = _latest(row.get(arrive_key))
+        t_s   = _latest(row.get(start_key))
+        t_f   = _latest(row.get(finish_key))
 
         # sanity guard
         if t_arr is None or t_s is None or t_f is None:
@@ -168,25 +247,26 @@ class ParallelBroker(BaseBroker):
         turn = round(t_f - t_arr, 4)
 
         # store with iteration-aware keys
-        self.job_records_manager.log_job_event(job.job_id, f"{phase}_wait_{iter_idx}", wait)
-        self.job_records_manager.log_job_event(job.job_id, f"{phase}_svc_{iter_idx}", svc)
-        self.job_records_manager.log_job_event(job.job_id, f"{phase}_turn_{iter_idx}", turn)
+        self.job_records_manager.log_job_events(job.job_id, (
+            (wait_key.format(iter_idx), wait),
+            (svc_key.format(iter_idx), svc),
+            (turn_key.format(iter_idx), turn),
+        ))
 
-        print(f"{self.env.now:.2f}: Job {job.job_id} {phase.upper()} metrics (iter {iter_idx}): "
-              f"wait={wait}, svc={svc}, turn={turn}")
+        if self.printlog:
+            print(f"{self.env.now:.2f}: Job {job.job_id} {phase.upper()} metrics (iter {iter_idx}): "
+                  f"wait={wait}, svc={svc}, turn={turn}")
 
     def _rec(self, job_id):
         """
         Shorthand to access a job's record dict safely.
         """
-        return getattr(self.job_records_manager, "records", {}).get(job_id, {})
+        if self._get_records is None:
+            return _EMPTY
+        return self._get_records().get(job_id, _EMPTY)
 
     def run(self):
         job = self.job
-        if not hasattr(job, "iteration"):
-            job.iteration = 0
-        if not hasattr(job, "iterations"):
-            job.iterations = 1
 
         while job.iteration < job.iterations:
             # ---------- QPU phase ----------
@@ -195,13 +275,13 @@ class ParallelBroker(BaseBroker):
             while qpu is None:
                 qpu = self._pick_device_by_capacity("QPU", q_needed)
                 if qpu is None:
-                    yield self.env.timeout(0.5)  # wait for capacity to free up
+                    yield self._capacity_released("QPU")  # wait for capacity to free up
 
             self._phase_start(job, "QPU", qpu)
 
             # Reserve qubits (this is the concurrency gate)
  
-            qpu_qubits = getattr(job, "num_qubits", 1)
+            qpu_qubits = job.num_qubits
             if self.printlog:
                 print(f"{self.env.now:.2f}: Job {job.job_id} requires {qpu_qubits} qubits; "
       f"{qpu.name} has {qpu.container.level}/{qpu.number_of_qubits} free")
@@ -221,7 +301,7 @@ class ParallelBroker(BaseBroker):
             while cpu is None:
                 cpu = self._pick_device_by_capacity("CPU", c_needed)
                 if cpu is None:
-                    yield self.env.timeout(0.5)
+                    yield self._capacity_released("CPU")
 
             self._phase_start(job, "CPU", cpu)
             # print(f"{self.env.now:.2f}: Job {job.job_id} processing on cpu")
@@ -238,7 +318,8 @@ class ParallelBroker(BaseBroker):
             if job.iteration >= job.iterations:
                 row = self._rec(job.job_id)
                 t0 = row.get("arrival", row.get("qpu_arrive"))
-                tf = row.get("cpu_finish")
+                t0 = t0[0] if isinstance(t0, list) else t0
+                tf = _latest(row.get("cpu_finish"))
                 if t0 is not None and tf is not None:
                     makespan = round(tf - t0, 4)
                     self.job_records_manager.log_job_event(job.job_id, "makespan", makespan)
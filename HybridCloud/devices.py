@@ -4,6 +4,10 @@ import simpy
 import random
 
 class CPU:
+    __slots__ = ("name", "type", "env", "queue", "container", "mem_bw", "resource",
+                 "cpu_capacity", "mem_bw_capacity", "maint_lock", "job_records_manager", "event_bus",
+                 "_draw_service", "_finish_tmpl")
+
     def __init__(self, name, env=None, cpu_capacity=100, mem_bw_capacity=200):
         """
         cpu_capacity:    total CPU units (integer)
@@ -18,6 +22,11 @@ class CPU:
         self.resource = None
         self.cpu_capacity = int(cpu_capacity)
         self.mem_bw_capacity = int(mem_bw_capacity)
+        self.maint_lock = False         # CPUs have no maintenance window
+        self.job_records_manager = None  # assigned by the simulation environment
+        self.event_bus = None
+        # 'device_finish' payload; process_job copies it and fills in job_id and timestamp
+        self._finish_tmpl = {"device": name, "job_id": None, "timestamp": None}
         if env is not None:
             self.assign_env(env)
 
@@ -27,36 +36,40 @@ class CPU:
         self.container = simpy.Container(env=env, capacity=self.cpu_capacity, init=self.cpu_capacity)
         self.mem_bw   = simpy.Container(env=env, capacity=self.mem_bw_capacity, init=self.mem_bw_capacity) 
         self.resource = simpy.PriorityResource(env=env, capacity=1)
+        # Batched NumPy draws when the environment provides them
+        self._draw_service = getattr(env, "draw_cpu_service", self._random_service)
+
+    def _random_service(self):
+        return random.uniform(1, 3), random.randint(4, 10)
 
     def maintenance(self, _):
         return self.env.timeout(0)  
             
     def process_job(self, job, wait_time_start):
         job_id = job.job_id
-        duration = random.uniform(1, 3)
-        cpu_units = random.randint(4, 10)
-        mem_bw    = int(getattr(job, "mem_bw",  20))
+        duration, cpu_units = self._draw_service()
+        mem_bw    = job.mem_bw
         
-        self.job_records_manager.log_job_event(job_id, 'devc_name', self.name)
+        env = self.env
+
         # phase arrival
-        self.job_records_manager.log_job_event(job_id, 'cpu_arrive', round(self.env.now, 4))
-        self.job_records_manager.log_job_event(job.job_id, 'cpu_units', cpu_units)
-        self.job_records_manager.log_job_event(job_id, 'cpu_mem_bw', mem_bw)
+        self.job_records_manager.log_job_events(job_id, (
+            ('devc_name', self.name),
+            ('cpu_arrive', env.now),
+            ('cpu_units', cpu_units),
+            ('cpu_mem_bw', mem_bw),
+        ))
         
-        yield self.container.get(cpu_units)
-        try:
-            yield self.mem_bw.get(mem_bw)
-        except:
-            # If mem_bw get fails for some reason, give CPU units back and re-raise
-            yield self.container.put(cpu_units)
-            raise
-            
+        # Acquire CPU units and memory bandwidth together in one scheduler wake-up
+        yield env.all_of([self.container.get(cpu_units), self.mem_bw.get(mem_bw)])
+
         # service start
         # self.job_records_manager.log_job_event(job_id, 'cpu_start', round(self.env.now, 4))
         
         # print(f"{self.env.now:.2f}: Job {job_id} running on {self.name} for {duration:.1f} (cpu_units={cpu_units}, mem_bw={mem_bw})")
 
-        yield self.env.timeout(duration)
+        yield env.timeout(duration)
+        now = env.now
 
         # service finish
         # self.job_records_manager.log_job_event(job_id, 'cpu_finish', round(self.env.now, 4))
@@ -64,15 +77,19 @@ class CPU:
         # print(f"{self.env.now:.2f}: Job {job.job_id} finished running on {self.name} for {duration:.1f}")
 
         # Publish a 'device_finish' event
-        self.event_bus.publish("device_finish", {
-            "device": self.name,
-            "job_id": job_id,
-            "timestamp": round(self.env.now, 2),
-        })
+        payload = self._finish_tmpl.copy()
+        payload["job_id"] = job_id
+        payload["timestamp"] = now
+        self.event_bus.publish("device_finish", payload)
         
         # always return capacity
         try:
-            yield self.container.put(cpu_units)
-            yield self.mem_bw.put(mem_bw)
+            yield env.all_of([self.container.put(cpu_units), self.mem_bw.put(mem_bw)])
         except Exception as e:
-            print(f"{self.env.now:.2f}: ERROR while returning units for Job {job.job_id} on {self.name}: {e}")            
\ No newline at end of file
+            print(f"{env.now:.2f}: ERROR while returning units for Job {job.job_id} on {self.name}: {e}")
+
+        # Wake brokers waiting for CPU capacity
+        self.event_bus.publish("capacity_released", {
+            "device": self.name,
+            "type": self.type,
+        })            
\ No newline at end of file
@@ -1,9 +1,11 @@
+from collections import defaultdict
+
 class EventBus:
     """
     A lightweight event bus for managing event-based communication.
     """
     def __init__(self):
-        self.subscribers = {}
+        self.subscribers = defaultdict(list)
 
     def subscribe(self, event_type, callback):
         """
@@ -13,9 +15,19 @@ class EventBus:
         - event_type (str): The type of event to subscribe to.
         - callback (callable): A function to be called when the event is published.
         """
-        if event_type not in self.subscribers:
-            self.subscribers[event_type] = []
-        self.subscribers[event_type].append(callback)
+        callbacks = self.subscribers[event_type]
+        if isinstance(callbacks, tuple):
+            # Subscribed after freeze(): keep the entry immutable
+            self.subscribers[event_type] = callbacks + (callback,)
+        else:
+            callbacks.append(callback)
+
+    def freeze(self):
+        """
+        Convert every subscriber list to a tuple once subscriptions are complete.
+        """
+        for event_type, callbacks in self.subscribers.items():
+            self.subscribers[event_type] = tuple(callbacks)
 
     def publish(self, event_type, data):
         """
@@ -25,6 +37,5 @@ class EventBus:
         - event_type (str): The type of event to publish.
         - data (dict): Event-related data to pass to subscribers.
         """
-        if event_type in self.subscribers:
-            for callback in self.subscribers[event_type]:
-                callback(data)
+        for callback in self.subscribers.get(event_type, ()):
+            callback(data)
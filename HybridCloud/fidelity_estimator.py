@@ -1,7 +1,12 @@
 # Implementation of Fidelity_Estimator class
 
+import numpy as np
 import pandas as pd
 
+# Calibration columns the estimator reads (headers may carry trailing spaces)
+_ERROR_COLUMNS = ("Readout assignment error", "RX error", "Pauli-X error")
+_CALIBRATION_COLUMNS = frozenset(_ERROR_COLUMNS + ("CZ error",))
+
 class Fidelity_Estimator:
     def __init__(self, calibration_file_path):
         """
@@ -10,23 +15,25 @@ class Fidelity_Estimator:
         Parameters:
         - calibration_file_path: Path to the CSV file containing calibration data.
         """
-        self.calibration_data = pd.read_csv(calibration_file_path)
+        calibration_data = pd.read_csv(calibration_file_path,
+                                       usecols=lambda c: c.strip() in _CALIBRATION_COLUMNS)
+        calibration_data.columns = calibration_data.columns.str.strip()
+        self.calibration_data = calibration_data.astype({c: np.float64 for c in _ERROR_COLUMNS})
         self.readout_errors, self.single_qubit_gate_errors, self.two_qubit_gate_errors = self.extract_errors_from_csv()
+        # Per-qubit readout success probabilities, reused by every estimate
+        self._one_minus_readout = 1.0 - self.readout_errors
 
     def extract_errors_from_csv(self):
         """
         Extract readout errors, single-qubit gate errors, and two-qubit gate errors from calibration data.
 
         Returns:
-        - readout_errors: List of readout assignment errors for each qubit.
+        - readout_errors: NumPy array of readout assignment errors for each qubit.
         - single_qubit_gate_errors: Dictionary with average single-qubit gate error rates.
         - two_qubit_gate_errors: Dictionary with error rates for two-qubit gates.
         """
-        # Remove trailing spaces from column names
-        self.calibration_data.columns = self.calibration_data.columns.str.strip()
-
-        # Extract readout errors: list of readout assignment errors for each qubit
-        readout_errors = self.calibration_data["Readout assignment error"].tolist()
+        # Extract readout errors: array of readout assignment errors for each qubit
+        readout_errors = self.calibration_data["Readout assignment error"].to_numpy(dtype=np.float64)
 
         # Extract single-qubit gate errors (using 'RX error' and 'Pauli-X error' as an example)
         single_qubit_gate_errors = {
@@ -34,13 +41,10 @@ class Fidelity_Estimator:
             "x": self.calibration_data["Pauli-X error"].mean()  # Average Pauli-X error
         }
 
-        # Extract two-qubit gate errors from the 'CZ error' column
-        two_qubit_gate_errors = {}
-        for cz_errors in self.calibration_data["CZ error"]:
-            pairs = cz_errors.split(";")
-            for pair in pairs:
-                gate, error = pair.split(":")
-                two_qubit_gate_errors[gate] = float(error)
+        # Extract two-qubit gate errors from the 'CZ error' column ("0_1:0.003;0_14:0.01")
+        pairs = self.calibration_data["CZ error"].dropna().str.split(";").explode()
+        parts = pairs.str.split(":", n=1, expand=True)
+        two_qubit_gate_errors = dict(zip(parts[0].to_numpy(), parts[1].astype(np.float64).to_numpy()))
 
         return readout_errors, single_qubit_gate_errors, two_qubit_gate_errors
 
@@ -64,9 +68,8 @@ class Fidelity_Estimator:
         # Estimate two-qubit gate fidelity
         two_qubit_fidelity = 1.0
 
-        # Estimate readout fidelity (average over the qubits used in the job)
-        avg_readout_error = sum(self.readout_errors[:num_qubits]) / num_qubits
-        readout_fidelity = (1 - avg_readout_error) ** num_qubits
+        # Estimate readout fidelity (product over the qubits used in the job)
+        readout_fidelity = float(np.prod(self._one_minus_readout[:num_qubits]))
 
         # Combined fidelity
         estimated_fidelity = single_qubit_fidelity * two_qubit_fidelity * readout_fidelity
@@ -1,13 +1,27 @@
 # hybridcloud.py
 
 class HybridCloud:
-    def __init__(self, env, qpu_devices, cpu_devices, job_records_manager=None, printlog=True):
+    def __init__(self, env, qpu_devices, cpu_devices, job_records_manager=None, event_bus=None, printlog=True):
         self.env = env
         self.qpus = qpu_devices
         self.cpus = cpu_devices
         self.job_records = {}  # Dictionary to track job lifecycle events
         self.job_records_manager = job_records_manager
 
+        # One pending event per device type, fired whenever a device of that type frees capacity
+        self.capacity_event = {"CPU": env.event(), "QPU": env.event()}
+        if event_bus is not None:
+            event_bus.subscribe("capacity_released", self.on_capacity_released)
+
+    def on_capacity_released(self, data):
+        """
+        Wake every broker waiting on the released device type and arm a fresh event.
+        """
+        device_type = data["type"]
+        event = self.capacity_event[device_type]
+        self.capacity_event[device_type] = self.env.event()
+        event.succeed()
+
     def log_job_event(self, job_id, event_type, timestamp):
         """
         Logs a job event with a timestamp.
@@ -20,6 +34,17 @@ class HybridCloud:
             self.job_records[job_id] = {}
         self.job_records[job_id][event_type] = timestamp        
 
+    def log_job_events(self, job_id, pairs):
+        """
+        Logs a sequence of events for one job in a single dict update; a repeated
+        event type keeps its last timestamp, as with log_job_event.
+
+        Parameters:
+        - job_id: The ID of the job.
+        - pairs: Iterable of (event_type, timestamp) tuples, e.g. dict.items().
+        """
+        self.job_records.setdefault(job_id, {}).update(pairs)
+
     def get_event_logger(self):
         """
         Returns a callback function for logging job events.
@@ -3,9 +3,14 @@
 from HybridCloud import *
 from HybridCloud.job_generator import JobGenerator
 from HybridCloud.hybridcloud import HybridCloud
+import heapq
+import numpy as np
+
+# Number of CPU service draws generated per RNG call
+RNG_BATCH = 1024
 
 class HybridCloudSimEnv(simpy.Environment):
-    def __init__(self, qpu_devices, cpu_devices, broker_class=ParallelBroker, job_feed_method='generator', job_generation_model=None, file_path=None, printlog = False):
+    def __init__(self, qpu_devices, cpu_devices, broker_class=ParallelBroker, job_feed_method='generator', job_generation_model=None, file_path=None, printlog = False, seed=None, admission_window=None):
         """
         Initialize the hybrid simulation environment.
 
@@ -16,8 +21,14 @@ class HybridCloudSimEnv(simpy.Environment):
         - job_feed_method: 'generator' or 'dispatcher'.
         - job_generation_model: Callable for job inter-arrival times.
         - file_path: Path to CSV if using dispatcher mode.
+        - seed: Seed for the simulation's NumPy random generator.
+        - admission_window: Optional window for largest-first job admission (see JobGenerator).
         """
         super().__init__()
+        self.rng = np.random.default_rng(seed)
+        self._cpu_durations = np.empty(0)
+        self._cpu_units = np.empty(0, dtype=np.int64)
+        self._cpu_draw_idx = 0
         self.qpu_devices = qpu_devices
         self.cpu_devices = cpu_devices
         self.broker_class = broker_class
@@ -25,17 +36,25 @@ class HybridCloudSimEnv(simpy.Environment):
         self.job_generation_model = job_generation_model
         self.file_path = file_path
         self.printlog = printlog
+        self.admission_window = admission_window
         self.event_bus = EventBus()
         self.job_records_manager = JobRecordsManager(self.event_bus)
 
+        # Device membership per type never changes, so split once here
+        all_devices = self.qpu_devices + self.cpu_devices
+        self.qpu_devices_list = [d for d in all_devices if d.type == "QPU"]
+        self.cpu_devices_list = [d for d in all_devices if d.type == "CPU"]
+
         self.qcloud = HybridCloud(
             env=self,
-            qpu_devices=self.qpu_devices,
-            cpu_devices=self.cpu_devices,
-            job_records_manager=self.job_records_manager
+            qpu_devices=self.qpu_devices_list,
+            cpu_devices=self.cpu_devices_list,
+            job_records_manager=self.job_records_manager,
+            event_bus=self.event_bus
         )
 
         self.job_generator = None
+        self._maintenance_started = False
         self._initialize_devices()
         self._initialize_job_generator()
 
@@ -45,7 +64,60 @@ class HybridCloudSimEnv(simpy.Environment):
             device.assign_env(self)
             device.job_records_manager = self.job_records_manager
             device.event_bus = self.event_bus
-            # self.process(device.maintenance(False))
+
+        # Per-type heaps of (-free_units, idx, device), consumed by the broker
+        self.qpu_heap = []
+        self.cpu_heap = []
+        self._heap_entries = {}
+
+        for idx, device in enumerate(self.qpu_devices_list + self.cpu_devices_list):
+            heap = self.cpu_heap if device.type == "CPU" else self.qpu_heap
+            heapq.heappush(heap, (-device.container.level, idx, device))
+            self._heap_entries[device.name] = (heap, idx, device)
+
+        self.event_bus.subscribe("capacity_released", self._refresh_device_heap)
+
+    def _start_maintenance(self):
+        """Start the QPU maintenance processes; deferred from construction to the first run()."""
+        if self._maintenance_started:
+            return
+        self._maintenance_started = True
+        for device in self.qpu_devices_list:
+            if device.maintenance_switch:
+                self.process(device.maintenance())
+
+    def _refresh_device_heap(self, data):
+        """
+        Re-insert a device into its heap once it has released capacity.
+
+        'capacity_released' is published after the units are put back, so the entry is keyed
+        by the current level. Keys therefore never understate a device's free capacity: levels
+        only drop in between, and the broker re-keys such stale entries on pop.
+        """
+        entry = self._heap_entries.get(data["device"])
+        if entry is None:
+            return
+        heap, idx, device = entry
+        heapq.heappush(heap, (-device.container.level, idx, device))
+        if len(heap) > 4 * len(self._heap_entries):
+            # Drop accumulated duplicates and rebuild from the current levels
+            live = {id(d): (-d.container.level, i, d) for _, i, d in heap}
+            heap[:] = list(live.values())
+            heapq.heapify(heap)
+
+    def draw_cpu_service(self):
+        """
+        Returns a (duration, cpu_units) pair for one CPU phase.
+
+        Values come from pre-drawn batches of RNG_BATCH samples, refilled on demand.
+        """
+        if self._cpu_draw_idx >= len(self._cpu_durations):
+            self._cpu_durations = self.rng.uniform(1, 3, size=RNG_BATCH)
+            self._cpu_units = self.rng.integers(4, 11, size=RNG_BATCH)
+            self._cpu_draw_idx = 0
+        i = self._cpu_draw_idx
+        self._cpu_draw_idx += 1
+        return float(self._cpu_durations[i]), int(self._cpu_units[i])
 
     def _initialize_job_generator(self):
 
@@ -59,11 +131,14 @@ class HybridCloudSimEnv(simpy.Environment):
             method=self.job_feed_method,
             job_generation_model=self.job_generation_model,
             file_path=self.file_path,
-            printlog=self.printlog
+            printlog=self.printlog,
+            admission_window=self.admission_window
         )
 
     def run(self, until=None):
         self.process(self.job_generator.run())
+        self._start_maintenance()
+        self.event_bus.freeze()
         print(f"{self.now:.2f}: SIMULATION STARTED")
         super().run(until=until if until is not None else None)
         # After run: print a summary of jobs seen vs finished
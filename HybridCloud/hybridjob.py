@@ -3,6 +3,10 @@
 from .job import Job
 
 class HybridJob(Job):
+    __slots__ = ("circuit_name", "num_qubits", "depth", "num_shots", "gates",
+                 "expected_exec_time", "noise_model", "phase", "iteration",
+                 "max_iterations", "iterations", "cpu_units", "mem_bw")
+
     def __init__(self,
                  job_id,
                  num_qubits,
@@ -15,7 +19,9 @@ class HybridJob(Job):
                  expected_exec_time=None,
                  noise_model=None,
                  phase = "quantum",
-                 max_iterations=3):
+                 max_iterations=3,
+                 cpu_units=8,
+                 mem_bw=20):
 
         super().__init__(job_id=job_id, arrival_time=arrival_time, priority=priority)
 
@@ -35,6 +41,11 @@ class HybridJob(Job):
         self.phase = "quantum"  # or "classical"
         self.iteration = 0
         self.max_iterations = max_iterations
+        self.iterations = max_iterations  # name the broker loops on
+
+        # Classical phase demand
+        self.cpu_units = int(cpu_units)
+        self.mem_bw = int(mem_bw)
 
     def __repr__(self):
         return (f"HybridJob(job_id={self.job_id}, "
@@ -1,6 +1,8 @@
 # job.py
 
 class Job:
+    __slots__ = ("job_id", "arrival_time", "priority", "start_time", "end_time")
+
     def __init__(self, job_id, arrival_time, priority):
         self.job_id = job_id
         self.arrival_time = arrival_time
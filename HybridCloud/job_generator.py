@@ -1,15 +1,38 @@
 #job_generator.py
             
 import json
-import random
 import csv
+import numpy as np
 from .qjob import QJob
 
+# Number of inter-arrival times drawn per RNG call in generator mode
+ARRIVAL_BATCH = 1024
+
+# Inclusive (low, high) ranges of generated job attributes: num_shots, depth, num_qubits, priority
+# num_shots range used for Sigsim: (10000, 100000)
+JOB_ATTR_LOW = (10000, 5, 5, 1)
+JOB_ATTR_HIGH = (15000, 20, 20, 2)
+
+# Read buffer for dispatcher CSV files (1 MiB)
+CSV_READ_BUFFER = 1 << 20
+
+# Job file fields in QJob.__init__ positional order
+QJOB_FIELDS = ("job_id", "num_qubits", "depth", "num_shots", "priority", "arrival_time", "iterations")
+
 class JobGenerator:
     """
     Generates jobs dynamically or dispatches predefined jobs from a .csv file.
+
+    In dispatcher mode the file is parsed when the generator is constructed, so a missing file,
+    a missing column or a malformed row is reported up front. `jobs` holds one tuple of fields
+    per job, in QJOB_FIELDS order; QJob objects are only built as the jobs are dispatched.
     """
-    def __init__(self, env, broker_class, devices, job_records_manager, event_bus, qcloud, method='generator', job_generation_model=None, file_path=None, printlog = False):
+    __slots__ = ("env", "broker_class", "devices", "job_records_manager", "event_bus", "qcloud", "method",
+                 "arrival_rate", "job_generation_model", "rng", "_deltas", "_delta_idx", "_job_attrs",
+                 "_job_attr_idx", "file_path", "printlog", "admission_window", "_admission_buffer",
+                 "job_id", "jobs")
+
+    def __init__(self, env, broker_class, devices, job_records_manager, event_bus, qcloud, method='generator', job_generation_model=None, file_path=None, printlog = False, admission_window=None):
         """
         Initialize the JobGenerator.
 
@@ -20,8 +43,11 @@ class JobGenerator:
         - job_records_manager: Instance of JobRecordsManager.
         - event_bus: Instance of EventBus.
         - method: 'generator' for dynamic job generation or 'dispatcher' for predefined jobs.
-        - job_generation_model: Callable for job inter-arrival times (used if method='generator').
+        - job_generation_model: Callable for job inter-arrival times, or a numeric arrival rate for
+          exponential inter-arrivals drawn in batches (used if method='generator'; default rate 3).
         - csv_file_path: Path to the .csv file containing predefined jobs (used if method='dispatcher').
+        - admission_window: If set, jobs arriving within this many time units are buffered and
+          released largest-first (by num_qubits) when the window closes.
         """
         self.env = env
         self.broker_class = broker_class
@@ -30,15 +56,28 @@ class JobGenerator:
         self.event_bus = event_bus
         self.qcloud = qcloud
         self.method = method
-        self.job_generation_model = job_generation_model or (lambda: random.expovariate(3))
+        if job_generation_model is None or isinstance(job_generation_model, (int, float)):
+            self.arrival_rate = 3.0 if job_generation_model is None else float(job_generation_model)
+            self.job_generation_model = self._next_exponential_delta
+        else:
+            self.arrival_rate = None
+            self.job_generation_model = job_generation_model
+        rng = getattr(env, "rng", None)
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self._deltas = np.empty(0)
+        self._delta_idx = 0
+        self._job_attrs = []
+        self._job_attr_idx = 0
         self.file_path = file_path
         self.printlog = printlog
-        # self.jobs = self._load_jobs_from_csv() if method == 'dispatcher' and csv_file_path else None
+        self.admission_window = admission_window
+        self._admission_buffer = []
         self.job_id = 1
+        self.jobs = None
 
         if method == 'dispatcher' and file_path:
             if file_path.endswith('.csv'):
-                self.jobs = self._load_jobs_from_csv()
+                self.jobs = self._load_jobs_from_csv(self.env.now)
             elif file_path.endswith('.json'):
                 self.jobs = self._load_jobs_from_json()
             else:
@@ -50,72 +89,132 @@ class JobGenerator:
         if method == 'dispatcher' and not file_path:
             raise ValueError("csv_file_path must be provided when method is 'dispatcher'.")
 
-    def _load_jobs_from_csv(self):
+    def _next_exponential_delta(self):
+        """
+        Returns the next exponential inter-arrival time from a pre-drawn batch.
+        """
+        if self._delta_idx >= len(self._deltas):
+            self._deltas = self.rng.exponential(1.0 / self.arrival_rate, size=ARRIVAL_BATCH)
+            self._delta_idx = 0
+        delta = self._deltas[self._delta_idx]
+        self._delta_idx += 1
+        return float(delta)
+
+    def _next_job_attrs(self):
+        """
+        Returns the next (num_shots, depth, num_qubits, priority) from a pre-drawn batch.
+        """
+        if self._job_attr_idx >= len(self._job_attrs):
+            self._job_attrs = self.rng.integers(JOB_ATTR_LOW, np.add(JOB_ATTR_HIGH, 1),
+                                                size=(ARRIVAL_BATCH, len(JOB_ATTR_LOW))).tolist()
+            self._job_attr_idx = 0
+        attrs = self._job_attrs[self._job_attr_idx]
+        self._job_attr_idx += 1
+        return attrs
+
+    def _load_jobs_from_csv(self, default_arrival):
         """
-        Load jobs from the specified .csv file.
+        Parse the specified .csv file into a list of job field tuples in QJOB_FIELDS order.
+
+        Parameters:
+        - default_arrival: Arrival time used for rows with an empty arrival_time.
         """
         jobs = []
-        with open(self.file_path, 'r') as csvfile:
-            reader = csv.DictReader(csvfile)
+        with open(self.file_path, 'r', buffering=CSV_READ_BUFFER, newline='') as csvfile:
+            reader = csv.reader(csvfile)
+            header = [name.strip() for name in next(reader, [])]
+            missing = [name for name in QJOB_FIELDS if name not in header]
+            if missing:
+                raise ValueError(f"{self.file_path}: missing column(s) {', '.join(missing)}.")
+            idx = {name: i for i, name in enumerate(header)}
+            i_job, i_qubits, i_depth = idx["job_id"], idx["num_qubits"], idx["depth"]
+            i_shots, i_priority = idx["num_shots"], idx["priority"]
+            i_arrival, i_iterations = idx["arrival_time"], idx["iterations"]
             for row in reader:
-                
-                arrival_time = self.env.now if row["arrival_time"].strip() == '' else float(row["arrival_time"])
-                iterations = 1 if row["iterations"].strip() == '' else int(row["iterations"])
-                jobs.append({
-                    "job_id": int(row["job_id"]),
-                    "num_qubits": int(row["num_qubits"]),
-                    "depth": int(row["depth"]),
-                    "num_shots": int(row["num_shots"]),
-                    "priority": int(row["priority"]),
-                    "arrival_time": arrival_time,
-                    "iterations": iterations
-                })
+                if not row:
+                    continue
+                try:
+                    arrival_time = row[i_arrival].strip()
+                    iterations = row[i_iterations].strip()
+                    jobs.append((
+                        int(row[i_job]),
+                        int(row[i_qubits]),
+                        int(row[i_depth]),
+                        int(row[i_shots]),
+                        int(row[i_priority]),
+                        default_arrival if arrival_time == '' else float(arrival_time),
+                        1 if iterations == '' else int(iterations)
+                    ))
+                except (ValueError, IndexError) as e:
+                    raise ValueError(f"{self.file_path}, line {reader.line_num}: malformed row ({e}).") from e
         return jobs
 
     def _load_jobs_from_json(self):
         """
-        Load jobs from the specified .json file.
+        Parse the specified .json file into a list of job field tuples in QJOB_FIELDS order.
         """
         with open(self.file_path, 'r') as jsonfile:
             data = json.load(jsonfile)
-            jobs = data.get("jobs", [])
+        jobs = []
+        for n, job_props in enumerate(data.get("jobs", [])):
+            try:
+                jobs.append(tuple(job_props[key] for key in QJOB_FIELDS))
+            except KeyError as e:
+                raise ValueError(f"{self.file_path}: job {n} is missing field {e}.") from e
         return jobs
 
+    def _submit(self, job):
+        """
+        Hand a job to a new broker, or buffer it when an admission window is configured.
+        """
+        if not self.admission_window:
+            self._start_broker(job)
+            return
+        if not self._admission_buffer:
+            self.env.process(self._close_admission_window())
+        self._admission_buffer.append(job)
+
+    def _close_admission_window(self):
+        """
+        Release the buffered jobs in decreasing size order once the window elapses.
+        """
+        yield self.env.timeout(self.admission_window)
+        batch, self._admission_buffer = self._admission_buffer, []
+        batch.sort(key=lambda job: job.num_qubits, reverse=True)
+        for job in batch:
+            self._start_broker(job)
+
+    def _start_broker(self, job):
+        broker = self.broker_class(
+            self.env,
+            job,
+            self.devices,
+            self.job_records_manager,   # ← pass the MANAGER
+            self.qcloud, 
+            self.printlog
+        )
+        self.env.process(broker.run())
+
     def run(self):
         """
         Run the job generator or dispatcher based on the selected method.
         """
         if self.method == 'dispatcher':  # Dispatch predefined jobs from .csv
 
-            for job_props in self.jobs:
+            for fields in self.jobs:
+                # QJobs are built one at a time as they are dispatched
+                job = QJob(*fields)
+
                 # Wait until the job's arrival time
 
-                delay = job_props["arrival_time"] - (self.env.now if self.env.now > 0 else 0)
+                delay = job.arrival_time - (self.env.now if self.env.now > 0 else 0)
                 yield self.env.timeout(max(delay, 0.01))
 
-                # Create the job
-                job = QJob(
-                    job_id=job_props["job_id"],
-                    num_qubits=job_props["num_qubits"],
-                    depth=job_props["depth"],
-                    num_shots=job_props["num_shots"],
-                    priority=job_props["priority"],
-                    arrival_time=job_props["arrival_time"],
-                    iterations = job_props["iterations"]
-                )
                 # Log job arrival
-                self.job_records_manager.log_job_event(job_props["job_id"], 'arrival', round(self.env.now, 2))
+                self.job_records_manager.log_job_event(job.job_id, 'arrival', round(self.env.now, 2))
 
                 # Pass the job to the broker
-                broker = self.broker_class(
-                    self.env,
-                    job,
-                    self.devices,
-                    self.job_records_manager,   # ← pass the MANAGER
-                    self.qcloud, 
-                    self.printlog
-                )
-                self.env.process(broker.run())
+                self._submit(job)
 
         elif self.method == 'generator':  # Generate jobs dynamically
             while True:
@@ -124,21 +223,16 @@ class JobGenerator:
                 yield self.env.timeout(inter_arrival_time)
 
                 # Generate a new job
-                # num_shots = random.randint(10000, 100000) #Sigsim
-                num_shots = random.randint(10000, 15000) 
+                num_shots, depth, num_qubits, priority = self._next_job_attrs()
                 arrival_time = self.env.now
-                depth = random.randint(5, 20)
-                num_qubits = random.randint(5, 20)
-                priority = random.randint(1, 2)
                 
                 # For job generator, self.job_id is assigned to QJob
-                job = QJob(self.job_id, num_qubits, depth, num_shots, priority, arrival_time) 
+                job = QJob(self.job_id, num_qubits, depth, num_shots, priority, arrival_time, iterations=1)
                 
                 # Log job arrival
                 self.job_records_manager.log_job_event(self.job_id, 'arrival', round(self.env.now, 2))
 
                 # Pass the job to the broker
-                broker = self.broker_class(self.env, job, self.devices, self.job_records_manager, self.qcloud)
-                self.env.process(broker.run())
+                self._submit(job)
 
                 self.job_id += 1
\ No newline at end of file
@@ -1,12 +1,18 @@
 # job_records_manager.py
 
+# Float values are rounded to this many decimals when records are materialized
+TIMESTAMP_DIGITS = 4
+
 class JobRecordsManager:
+    __slots__ = ("event_bus", "events", "_job_records")
+
     def __init__(self, event_bus):
         """
         Initialize the JobRecordsManager with an EventBus instance.
         """
         self.event_bus = event_bus
-        self.job_records = {}
+        self.events = []  # (job_id, event_type, timestamp) logged since the last get_job_records()
+        self._job_records = {}
 
     def log_job_event(self, job_id, event_type, timestamp):
         """
@@ -17,20 +23,49 @@ class JobRecordsManager:
         - event_type: The type of event (e.g., 'arrival', 'start', 'finish', 'devc_start', 'devc_finish').
         - timestamp: The timestamp of the event.
         """
-        if job_id not in self.job_records:
-            self.job_records[job_id] = {}
-        
-        # Append the timestamp if the event_type already exists
-        if event_type in self.job_records[job_id]:
-            if isinstance(self.job_records[job_id][event_type], list):
-                self.job_records[job_id][event_type].append(timestamp)
-            else:
-                self.job_records[job_id][event_type] = [self.job_records[job_id][event_type], timestamp]
-        else:
-            self.job_records[job_id][event_type] = timestamp
+        self.events.append((job_id, event_type, timestamp))
+
+    def log_job_events(self, job_id, pairs):
+        """
+        Logs a sequence of events for one job in a single call. The same event type
+        may appear more than once; pass dict.items() to log a mapping.
+
+        Parameters:
+        - job_id: The ID of the job.
+        - pairs: Iterable of (event_type, timestamp) tuples, in logging order.
+        """
+        self.events.extend((job_id, event_type, timestamp) for event_type, timestamp in pairs)
 
     def get_job_records(self):
         """
-        Returns all job records.
+        Returns all job records as a nested dict of job_id -> event_type -> timestamp.
+        Events logged more than once for a job are returned as a list of timestamps.
+        Float values are rounded to TIMESTAMP_DIGITS decimals, so writers may log raw
+        env.now values. Only events logged since the previous call are folded in; they are
+        then dropped from the events log, so each event is held once.
         """
-        return self.job_records
+        records = self._job_records
+        events = self.events
+        for job_id, event_type, timestamp in events:
+            if isinstance(timestamp, float):
+                timestamp = round(timestamp, TIMESTAMP_DIGITS)
+            record = records.get(job_id)
+            if record is None:
+                records[job_id] = {event_type: timestamp}
+                continue
+
+            # Append the timestamp if the event_type already exists
+            if event_type in record:
+                previous = record[event_type]
+                if isinstance(previous, list):
+                    previous.append(timestamp)
+                else:
+                    record[event_type] = [previous, timestamp]
+            else:
+                record[event_type] = timestamp
+        events.clear()
+        return records
+
+    @property
+    def job_records(self):
+        return self.get_job_records()
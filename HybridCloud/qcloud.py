@@ -6,6 +6,8 @@ import random
 import math
 
 class QCloud:
+    __slots__ = ("env", "devices", "job_records_manager", "printlog", "allocation_strategies", "allocate_job")
+
     def __init__(self, env, devices, job_records_manager, allocation_mode="simple", printlog=True):
         """
         Initializes the QCloud class.
@@ -16,7 +18,6 @@ class QCloud:
         """
         self.env = env
         self.devices = devices
-        self.job_records = {}  # Dictionary to track job lifecycle events
         self.job_records_manager = job_records_manager
         # self.error_aware = False
         self.printlog = printlog
@@ -27,40 +28,12 @@ class QCloud:
             "smart": self.smart_allocate_large_job
         }
 
-        # Set the allocation mode
+        # Set the allocation mode; allocate_job(job, devices) is bound straight to the strategy
         if allocation_mode in self.allocation_strategies:
-            self.allocation_function = self.allocation_strategies[allocation_mode]
+            self.allocate_job = self.allocation_strategies[allocation_mode]
         else:
             raise ValueError(f"Invalid allocation mode: {allocation_mode}. Choose from {list(self.allocation_strategies.keys())}.")        
 
-    def allocate_job(self, job, devices):
-        """
-        Dynamically calls the selected job allocation function.
-
-        Parameters:
-        - job: The QJob object representing the job.
-        - devices: List of quantum devices.
-        """
-        return self.allocation_function(job, devices)
-    
-    def log_job_event(self, job_id, event_type, timestamp):
-        """
-        Logs a job event with a timestamp.
-
-        Parameters:
-        - job_id: The ID of the job.
-        - event_type: The type of event ('arrival', 'start', or 'finish').
-        """
-        if job_id not in self.job_records:
-            self.job_records[job_id] = {}
-        self.job_records[job_id][event_type] = timestamp
-
-    def get_event_logger(self):
-        """
-        Returns a callback function for logging job events.
-        """
-        return self.log_job_event
-
     def device_comm(self, job, device1, device2, qubits_required, feedback=False):
         comm_time = qubits_required * 0.02  # Adjust communication latency
         if self.printlog:
@@ -82,13 +55,62 @@ class QCloud:
         """
         Calculate processing time considering IBM-specific metrics.
         """
-        M = 100
-        K = 10
-        S = job.num_shots
-        D = math.log2(device.qvol)
-
-        return  M * K * S * D / device.clops / 60
+        return job.num_shots * device._time_coeff
     
+    def _find_eligible(self, job, devices):
+        """
+        Find devices that can host an even share of the job on a connected subgraph.
+        select_vertices_fast caches its result per device until the device graph changes,
+        so rescans after a release only search devices whose qubits actually changed.
+
+        Parameters:
+        - job: The QJob object representing the job.
+        - devices: List of quantum devices.
+
+        Returns:
+        - List of (device, subgraph, error_score, clops) tuples.
+        """
+        need_level = job.num_qubits / len(devices)
+        need_qubits = job.num_qubits // len(devices)
+        eligible_devices = []
+        for device in devices:
+            if device.container.level >= need_level:
+                selected_subgraph = select_vertices_fast(device, need_qubits, job.job_id)
+                if selected_subgraph:
+                    eligible_devices.append((device, selected_subgraph, device.error_score, device.clops))
+        return eligible_devices
+
+    def _any_release(self, devices):
+        """
+        Event that fires once any of the devices frees qubits or leaves maintenance.
+        Eligibility can only improve at those points, so there is nothing to poll for in between.
+        """
+        return self.env.any_of([device.release_event for device in devices])
+
+    def _process_time_and_fidelity(self, job, allocated_devices):
+        """
+        Longest per-device processing time and mean per-device fidelity of a split job,
+        computed in a single pass over the allocated devices.
+
+        Parameters:
+        - job: The QJob object representing the job.
+        - allocated_devices: List of (device, qubits, subgraph, clops) tuples.
+
+        Returns:
+        - Tuple of (max process time, average fidelity).
+        """
+        depth = job.depth
+        readout_exp = math.sqrt(job.num_qubits // len(allocated_devices))
+        max_process_time = 0.0
+        fidelity_sum = 0.0
+        for device, _, _, _ in allocated_devices:
+            process_time = self.calculate_process_time(device, job)
+            if process_time > max_process_time:
+                max_process_time = process_time
+            # Error rates are read at allocation time, so values set after QCloud is built are honoured
+            fidelity_sum += ((1.0 - device.avg_single_qubit_error) ** depth) * ((1.0 - device.avg_readout_error) ** readout_exp)
+        return max_process_time, fidelity_sum / len(allocated_devices)
+
     def simple_allocate_large_job(self, job, devices):
         """
         Allocate a large job across multiple devices with error-aware or error-agnostic scheduling.
@@ -102,75 +124,63 @@ class QCloud:
                 print(f"Available qubits for {d.name}: {d.container.level}, CLOPS: {d.clops}, ERR: {d.error_score}")
 
         # Step 1: Identify eligible devices
-        eligible_devices = []
-        for device in devices:
-            if device.container.level >= job.num_qubits / len(devices):
-                selected_subgraph = select_vertices_fast(device, job.num_qubits // len(devices), job.job_id)
-                if selected_subgraph:                    
-                    eligible_devices.append((device, selected_subgraph, device.error_score, device.clops))
+        eligible_devices = self._find_eligible(job, devices)
 
         # Step 2: Ensure sufficient devices are available
         while len(eligible_devices) < 2:
             if self.printlog:
                 print(f"{self.env.now:.2f}: Insufficient connected devices to allocate job #{job.job_id}. Retrying...")
-            yield self.env.timeout(1)
-            eligible_devices = []
-            for device in devices:
-                if device.container.level >= job.num_qubits / len(devices):
-                    selected_subgraph = select_vertices_fast(device, job.num_qubits // len(devices), job.job_id)
-                    if selected_subgraph:
-                        eligible_devices.append((device, selected_subgraph, device.error_score, device.clops))
+            yield self._any_release(devices)
+            eligible_devices = self._find_eligible(job, devices)
 
 
         # Step 3: Select devices to allocate
         split_qubits = job.num_qubits // len(eligible_devices)
         remainder_qubits = job.num_qubits % len(eligible_devices)
         allocated_devices = []
+        events_to_log = []
         
-        # Step 4: Split job across selected devices optimally
-        for idx, (device, subgraph, error_score, clops) in enumerate(eligible_devices):
+        # Step 4: Split job across selected devices optimally; the devices are independent,
+        # so all qubit requests are issued together
+        for idx, (device, subgraph, _, clops) in enumerate(eligible_devices):
             allocated_qubits = split_qubits + (1 if idx < remainder_qubits else 0)
-            with device.resource.request(priority=2) as req:
-                yield device.container.get(allocated_qubits)
-                allocated_devices.append((device, allocated_qubits, subgraph, clops))
-                if self.printlog:
-                    print(f"{self.env.now:.2f}: Job #{job.job_id} allocated {allocated_qubits} qubits on {device.name} (error score: {error_score:.4f}).")
+            allocated_devices.append((device, allocated_qubits, subgraph, clops))
+        yield self.env.all_of([device.container.get(allocated_qubits) for device, allocated_qubits, _, _ in allocated_devices])
 
-                # Log per-device allocation start
-                self.job_records_manager.log_job_event(job.job_id, 'devc_proc', round(self.env.now, 4))
+        # Per-device allocation start, logged once the split is complete
+        events_to_log.extend([('devc_proc', self.env.now)] * len(allocated_devices))
+        if self.printlog:
+            for (device, allocated_qubits, _, _), (_, _, error_score, _) in zip(allocated_devices, eligible_devices):
+                print(f"{self.env.now:.2f}: Job #{job.job_id} allocated {allocated_qubits} qubits on {device.name} (error score: {error_score:.4f}).")
 
-        # Step 5: process inter-device communication by pairing devices 
+        # Step 5: process inter-device communication by pairing devices; pairs communicate concurrently
+        comms = []
         for i in range(len(allocated_devices) - 1):
             device1, qubits1, _, _ = allocated_devices[i]
             device2, qubits2, _, _ = allocated_devices[i + 1]
-            yield self.env.process(self.device_comm(job, device1, device2, qubits1 + qubits2))
+            comms.append(self.env.process(self.device_comm(job, device1, device2, qubits1 + qubits2)))
+        yield self.env.all_of(comms)
 
-        # Step 6: Process communication time  
-        process_times = [self.calculate_process_time(device, job) for device, _, _, _ in allocated_devices]
-        yield self.env.timeout(max(process_times))  # Max execution time across devices
+        # Step 6: Process communication time; fidelity (Step 8) is computed in the same pass
+        max_process_time, avg_fidelity = self._process_time_and_fidelity(job, allocated_devices)
+        yield self.env.timeout(max_process_time)  # Max execution time across devices
 
         # Step 7: Release resources after completion
-        for device, allocated_qubits, _, _ in allocated_devices:
-            yield device.container.put(allocated_qubits)
-            self.job_records_manager.log_job_event(job.job_id, 'devc_finish', round(self.env.now, 4))
-            if self.printlog:
+        yield self.env.all_of([device.container.put(allocated_qubits) for device, allocated_qubits, _, _ in allocated_devices])
+        for device, _, _, _ in allocated_devices:
+            device._signal_release()  # Wake jobs waiting in Step 2
+        events_to_log.extend([('devc_finish', self.env.now)] * len(allocated_devices))
+        if self.printlog:
+            for device, _, _, _ in allocated_devices:
                 print(f"{self.env.now:.2f}: Job #{job.job_id} completed on {device.name}.")
              
-        # Step 8: Compute Fidelity
-        fidelities = []
-        for device, _, _, _ in allocated_devices:  
-            single_qubit_fidelity = (1 - device.avg_single_qubit_error) ** job.depth             
-            readout_fidelity = (1 - device.avg_readout_error) ** ((job.num_qubits // len(eligible_devices)) ** 0.5 ) 
-            device_fidelity = single_qubit_fidelity * readout_fidelity
-            fidelities.append(device_fidelity)
-
         # Step 9: Compute final fidelity with communication penalty
-        avg_fidelity = sum(fidelities) / len(fidelities) if fidelities else -1.0
         num_connections = len(allocated_devices) - 1  # Number of times devices communicate
         communication_penalty = 0.94 ** num_connections  # Decay for each communication
         final_fidelity = avg_fidelity * communication_penalty  # Final fidelity
         
-        self.job_records_manager.log_job_event(job.job_id, 'fidelity', round(final_fidelity,4))
+        events_to_log.append(('fidelity', final_fidelity))
+        self.job_records_manager.log_job_events(job.job_id, events_to_log)
  
 
 
@@ -187,24 +197,15 @@ class QCloud:
                 print(f"Available qubits for {d.name}: {d.container.level}, CLOPS: {d.clops}, ERR: {d.error_score}")
 
         # Step 1: Identify eligible devices
-        eligible_devices = []
-        for device in devices:
-            if device.container.level >= job.num_qubits / len(devices):
-                selected_subgraph = select_vertices_fast(device, job.num_qubits // len(devices), job.job_id)
-                if selected_subgraph:   
-                    eligible_devices.append((device, selected_subgraph, device.error_score, device.clops))
-        
+        eligible_devices = self._find_eligible(job, devices)
+
         # Step 2: Ensure sufficient devices are available
         while len(eligible_devices) < 2:
             if self.printlog:
                 print(f"{self.env.now:.2f}: Insufficient connected devices to allocate job #{job.job_id}. Retrying...")
-            yield self.env.timeout(1)
-            eligible_devices = []
-            for device in devices:
-                if device.container.level >= job.num_qubits / len(devices):
-                    selected_subgraph = select_vertices_fast(device, job.num_qubits // len(devices), job.job_id)
-                    if selected_subgraph:
-                        eligible_devices.append((device, selected_subgraph, device.error_score, device.clops))
+            yield self._any_release(devices)
+            eligible_devices = self._find_eligible(job, devices)
+
 
         # Sort by lowest error score first then minimize the device usage
         eligible_devices.sort(key=lambda x: x[2])  
@@ -216,48 +217,46 @@ class QCloud:
         split_qubits = job.num_qubits // num_devices_to_use
         remainder_qubits = job.num_qubits % num_devices_to_use
         allocated_devices = []
+        events_to_log = []
     
-        # Step 4: Split job across selected devices optimally
-        for idx, (device, subgraph, error_score, clops) in enumerate(selected_devices):
+        # Step 4: Split job across selected devices optimally; the devices are independent,
+        # so all qubit requests are issued together
+        for idx, (device, subgraph, _, clops) in enumerate(selected_devices):
             allocated_qubits = split_qubits + (1 if idx < remainder_qubits else 0)
-            with device.resource.request(priority=2) as req:
-                yield device.container.get(allocated_qubits)
-                allocated_devices.append((device, allocated_qubits, subgraph, clops))
-                if self.printlog:
-                    print(f"{self.env.now:.2f}: Job #{job.job_id} allocated {allocated_qubits} qubits on {device.name} (error score: {error_score:.4f}).")
+            allocated_devices.append((device, allocated_qubits, subgraph, clops))
+        yield self.env.all_of([device.container.get(allocated_qubits) for device, allocated_qubits, _, _ in allocated_devices])
 
-                # Log per-device allocation start
-                self.job_records_manager.log_job_event(job.job_id, 'devc_proc', round(self.env.now, 4))
+        # Per-device allocation start, logged once the split is complete
+        events_to_log.extend([('devc_proc', self.env.now)] * len(allocated_devices))
+        if self.printlog:
+            for (device, allocated_qubits, _, _), (_, _, error_score, _) in zip(allocated_devices, selected_devices):
+                print(f"{self.env.now:.2f}: Job #{job.job_id} allocated {allocated_qubits} qubits on {device.name} (error score: {error_score:.4f}).")
 
-        # Step 5: process inter-device communication by pairing devices 
+        # Step 5: process inter-device communication by pairing devices; pairs communicate concurrently
+        comms = []
         for i in range(len(allocated_devices) - 1):
             device1, qubits1, _, _ = allocated_devices[i]
             device2, qubits2, _, _ = allocated_devices[i + 1]
-            yield self.env.process(self.device_comm(job, device1, device2, qubits1 + qubits2))
+            comms.append(self.env.process(self.device_comm(job, device1, device2, qubits1 + qubits2)))
+        yield self.env.all_of(comms)
 
-        # Step 6: Process communication time  
-        process_times = [self.calculate_process_time(device, job) for device, _, _, _ in allocated_devices]
-        yield self.env.timeout(max(process_times))
+        # Step 6: Process communication time; fidelity (Step 8) is computed in the same pass
+        max_process_time, avg_fidelity = self._process_time_and_fidelity(job, allocated_devices)
+        yield self.env.timeout(max_process_time)
 
         # Step 7: Release resources after completion
-        for device, allocated_qubits, _, _ in allocated_devices:
-            yield device.container.put(allocated_qubits)
-            self.job_records_manager.log_job_event(job.job_id, 'devc_finish', round(self.env.now, 4))
-            if self.printlog:
-                print(f"{self.env.now:.2f}: Job #{job.job_id} completed on {device.name}.")
-
-        # Step 8: Compute Fidelity
-        fidelities = []
+        yield self.env.all_of([device.container.put(allocated_qubits) for device, allocated_qubits, _, _ in allocated_devices])
         for device, _, _, _ in allocated_devices:
-            single_qubit_fidelity = (1 - device.avg_single_qubit_error) ** job.depth
-            readout_fidelity = (1 - device.avg_readout_error) ** ( (job.num_qubits // len(allocated_devices)) ** 0.5 )
-            device_fidelity = single_qubit_fidelity * readout_fidelity
-            fidelities.append(device_fidelity)
+            device._signal_release()  # Wake jobs waiting in Step 2
+        events_to_log.extend([('devc_finish', self.env.now)] * len(allocated_devices))
+        if self.printlog:
+            for device, _, _, _ in allocated_devices:
+                print(f"{self.env.now:.2f}: Job #{job.job_id} completed on {device.name}.")
 
         # Step 9: Compute final fidelity with communication penalty
-        avg_fidelity = sum(fidelities) / len(fidelities) if fidelities else -1.0
         num_connections = len(allocated_devices) - 1  
         communication_penalty = 0.94 ** num_connections  
         final_fidelity = avg_fidelity * communication_penalty  
 
-        self.job_records_manager.log_job_event(job.job_id, 'fidelity', round(final_fidelity,4))
\ No newline at end of file
+        events_to_log.append(('fidelity', final_fidelity))
+        self.job_records_manager.log_job_events(job.job_id, events_to_log)
\ No newline at end of file
@@ -25,6 +25,7 @@ class QCloudSimEnv(simpy.Environment):
         self.job_records_manager = JobRecordsManager(self.event_bus)  # Shared JobRecordsManager
         self.qcloud = QCloud(self, self.devices, self.job_records_manager)
         self.job_generator = None
+        self._maintenance_started = False
         self._initialize_devices()
         self._initialize_job_generator()
 
@@ -34,7 +35,15 @@ class QCloudSimEnv(simpy.Environment):
             device.assign_env(self)
             device.job_records_manager = self.job_records_manager
             device.event_bus = self.event_bus
-            self.process(device.maintenance(False))
+
+    def _start_maintenance(self):
+        """Start the device maintenance processes; deferred from construction to the first run()."""
+        if self._maintenance_started:
+            return
+        self._maintenance_started = True
+        for device in self.devices:
+            if device.maintenance_switch:
+                self.process(device.maintenance())
 
     def _initialize_job_generator(self):
         """Initialize the job generator based on the feed method."""
@@ -59,6 +68,7 @@ class QCloudSimEnv(simpy.Environment):
         """
         # Start job generation
         self.process(self.job_generator.run())
+        self._start_maintenance()
 
         # Run the simulation
         if until is not None:
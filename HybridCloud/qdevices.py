@@ -7,13 +7,66 @@ import json
 import os
 import random
 import pandas as pd
+import numpy as np
 import math
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from types import MappingProxyType
+
+# orjson is optional; it decodes the topology files faster than the stdlib parser
+try:
+    import orjson
+    def _load_json(f):
+        return orjson.loads(f.read())
+except ImportError:
+    _load_json = json.load
+
+@lru_cache(maxsize=32)
+def _load_topology(nodes_file_name, pos_file_name):
+    """
+    Loads the nodes and positions from the specified JSON files in the topology directory.
+    Results are shared between devices, so they are returned read-only: the nodes as a
+    tuple of edge tuples and the positions as a read-only mapping.
+    """
+    # Get the directory of the current file
+    current_dir = os.path.dirname(os.path.abspath(__file__))  
+    topology_dir = os.path.join(current_dir, 'topology')
+    nodes_file = os.path.join(topology_dir, nodes_file_name)
+    pos_file = os.path.join(topology_dir, pos_file_name)
+    
+    with open(nodes_file, 'rb') as f:
+        nodes = tuple(tuple(edge) for edge in _load_json(f)['nodes'])
+ 
+    with open(pos_file, 'rb') as f:
+        pos = MappingProxyType({int(k): tuple(v) for k, v in _load_json(f)['pos'].items()})
+    
+    return nodes, pos
+
+@lru_cache(maxsize=32)
+def _topology_index(nodes_file_name, pos_file_name):
+    """
+    Builds the read-only structures derived from a topology once per file pair: the neighbour
+    tuples of each node, the node -> position map in graph node order (the color_code order) and
+    the topology edges as arrays of endpoint positions.
+    """
+    nodes, _ = _load_topology(nodes_file_name, pos_file_name)
+    graph = nx.Graph()
+    graph.add_edges_from(nodes)
+
+    neighbors = {n: tuple(graph.neighbors(n)) for n in graph.nodes()}
+    node_index = {n: i for i, n in enumerate(graph.nodes)}
+    edges_u = np.fromiter((node_index[u] for u, _ in nodes), dtype=np.int32, count=len(nodes))
+    edges_v = np.fromiter((node_index[v] for _, v in nodes), dtype=np.int32, count=len(nodes))
+    edges_u.flags.writeable = False
+    edges_v.flags.writeable = False
+    return MappingProxyType(neighbors), MappingProxyType(node_index), edges_u, edges_v
 
 class BaseQDevice(ABC):
     """
     Abstract base class for quantum devices.
     """
+    __slots__ = ("name", "env", "event_bus", "__weakref__")
+
     def __init__(self, name, env, event_bus):
         """
         Initialize a base device.
@@ -61,8 +114,8 @@ class QuantumDevice(BaseQDevice):
             File name that contains a list of nodes representing the connections between qubits in JSON format.
         pos_file_name : str
             File name that contains a dictionary representing the positions of the qubits for visualization purposes in JSON format.
-    color_map : list
-        A list of color representing the color of nodes. 
+    color_code : numpy.ndarray
+        uint8 color code of each node in graph order, indexing COLOR_NAMES (0 is 'skyblue', a free qubit).
     number_of_qubits: int
         An integer representing the number of physical qubits available.
     env : simpy.Environment
@@ -73,6 +126,13 @@ class QuantumDevice(BaseQDevice):
         A resource manager in simpy for handling shared resources.
     """
 
+    __slots__ = ("maintenance_interval", "maintenance_duration", "maintenance_switch", "maint_lock",
+                 "job_records_manager", "printlog", "type", "_start_tmpl", "_finish_tmpl",
+                 "nodes", "pos", "number_of_qubits", "color_code", "graph", "prog_neighbors", "_selection_cache", "_components", "_xy",
+                 "node_index", "edges_u", "edges_v", "queue", "container", "resource", "release_event",
+                 # Scores read by QCloud when splitting jobs across devices
+                 "error_score", "avg_single_qubit_error", "avg_readout_error")
+
     def __init__(self, name, nodes_file_name, pos_file_name, env, maintenance_interval, maintenance_duration, maintenance_switch, event_bus=None, job_records_manager=None, printlog=True):
         """
         Initializes the QuantumDevice with a name, nodes, and positions.
@@ -85,8 +145,6 @@ class QuantumDevice(BaseQDevice):
             File name that contains a list of nodes representing the connections between qubits in JSON format.
         pos_file_name : str
             File name that contains a dictionary representing the positions of the qubits for visualization purposes in JSON format.
-        color_map : list
-            A list of color representing the color of nodes. 
         number_of_qubits: int
             An integer representing the number of physical qubits available.
         env : simpy.Environment
@@ -101,6 +159,10 @@ class QuantumDevice(BaseQDevice):
         self.event_bus = event_bus
         self.printlog = printlog
         self.type = "QPU"        
+
+        # Event payloads differ per job only in job_id and timestamp; process_job copies these
+        self._start_tmpl = {"device": name, "job_id": None, "timestamp": None}
+        self._finish_tmpl = {"device": name, "job_id": None, "timestamp": None}
         
         # Load nodes and positions from files
         self.nodes, self.pos = self.load_topology(nodes_file_name, pos_file_name)
@@ -108,16 +170,35 @@ class QuantumDevice(BaseQDevice):
         # number of qubits calculated from position dictionary
         self.number_of_qubits = len(self.pos)
         
-        # generate the color_map as 'skyblue' for each qubit
-        self.color_map = ['skyblue' for _ in range(self.number_of_qubits)]
+        # every qubit starts 'skyblue' (code 0); jobs recolor nodes through remove_connectivity
+        self.color_code = np.zeros(self.number_of_qubits, dtype=np.uint8)
         
-        # Initialize the graph with nodes
+        # Initialize the graph with nodes; jobs remove and restore edges, so each device builds its own
+        # (from the edge list rather than Graph.copy(), which reorders neighbours)
         self.graph = nx.Graph()
         self.graph.add_edges_from(self.nodes)
+        neighbors, self.node_index, self.edges_u, self.edges_v = _topology_index(nodes_file_name, pos_file_name)
+
+        # Neighbour lists of the current graph, kept in sync by remove_connectivity/reconnect_nodes
+        self.prog_neighbors = {n: list(nbrs) for n, nbrs in neighbors.items()}
+
+        # select_vertices_fast results for the current graph state, keyed by number of qubits;
+        # emptied by remove_connectivity/reconnect_nodes whenever the graph changes
+        self._selection_cache = {}
+
+        # Connected-component labelling used by select_vertices, built on first use
+        self._components = None
+
+        # Node positions as an array for display_graph, built on first use
+        self._xy = None
         
         # Initialize the simpy container and resource
         # self.container = simpy.Container(env=self.env, capacity=len(self.pos), init=len(self.pos))
         # self.resource = simpy.PriorityResource(env=env, capacity=1)
+        self.queue = None       # SimPy-dependent attributes are created in assign_env
+        self.container = None
+        self.resource = None
+        self.release_event = None
         self.maint_lock = False
 
     # def execute(self, job):
@@ -133,53 +214,61 @@ class QuantumDevice(BaseQDevice):
         self.queue = simpy.Resource(env, capacity=1)
         self.container = simpy.Container(env=env, capacity=len(self.pos), init=len(self.pos))
         self.resource = simpy.PriorityResource(env=env, capacity=1)
-
-        # Start maintenance process if required
-        if self.maintenance_switch:
-            self.env.process(self.maintenance())
+        self.release_event = env.event()  # Triggered whenever qubits are reconnected or maintenance ends
             
+    @property
+    def color_map(self):
+        """
+        Read-only color names of the nodes in graph order, decoded from color_code for plotting.
+        Recolor nodes through remove_connectivity/reconnect_nodes, which update color_code.
+        """
+        return tuple([COLOR_NAMES[c] for c in self.color_code.tolist()])
+
     def load_topology(self, nodes_file_name, pos_file_name):
         
-        """Loads the nodes and positions from the specified JSON files."""
-        
-        # Get the directory of the current file
-        current_dir = os.path.dirname(os.path.abspath(__file__))  
-        topology_dir = os.path.join(current_dir, 'topology')
-        nodes_file = os.path.join(topology_dir, nodes_file_name)
-        pos_file = os.path.join(topology_dir, pos_file_name)
-        
-        with open(nodes_file, 'r') as f:
-            nodes = json.load(f)['nodes']
-     
-        with open(pos_file, 'r') as f:
-            pos = {int(k): tuple(v) for k, v in json.load(f)['pos'].items()}
+        """Loads the nodes and positions from the specified JSON files (parsed once per file pair)."""
         
-        return nodes, pos
+        return _load_topology(nodes_file_name, pos_file_name)
     
-    def maintenance(self, maintenance_switch):
+    def maintenance(self):
         """
         Maintenance process that will run at regular intervals.
         The interval and duration of maintenance are set by the child class.
+        Started once per device by the simulation environment's _start_maintenance on the first
+        run(), and only when maintenance_switch is set.
         """
+        # Random offset so devices sharing an interval do not go down together
         yield self.env.timeout(random.randint(60, 120))
         
-        if self.maintenance_switch: 
-            while True:
-                # Wait for the maintenance interval
-                yield self.env.timeout(self.maintenance_interval)
-                             
-                # New job won't be able to process on the machine
-                self.maint_lock = True
-                
-                # Block the resource during maintenance with highest priority (priority=1)
-                with self.resource.request(priority=1) as req:
-
-                    remaining_qubits = self.container.level                                                   
-                    yield self.env.timeout(self.maintenance_duration)
-
-                    # Job will be able to assign the machine again
-                    self.maint_lock = False
+        while True:
+            # Wait for the maintenance interval
+            yield self.env.timeout(self.maintenance_interval)
+                         
+            # New job won't be able to process on the machine
+            self.maint_lock = True
+            
+            # Block the resource during maintenance with highest priority (priority=1)
+            with self.resource.request(priority=1) as req:
+
+                remaining_qubits = self.container.level                                                   
+                yield self.env.timeout(self.maintenance_duration)
+
+                # Job will be able to assign the machine again
+                self.maint_lock = False
+                self._signal_release()
+                if self.event_bus is not None:
+                    self.event_bus.publish("capacity_released", {
+                        "device": self.name,
+                        "type": self.type,
+                    })
             
+    def _signal_release(self):
+        """
+        Wakes every job waiting on this device for free qubits or for maintenance to end.
+        """
+        released, self.release_event = self.release_event, self.env.event()
+        released.succeed()
+
     def calculate_process_time(self, job):
         """Simple way to calculate the processing time based on the number of qubits required.
             Child class will override this"""
@@ -192,38 +281,44 @@ class QuantumDevice(BaseQDevice):
         job_id = job.job_id
         qubits_required = job.num_qubits
         """Process a job on this quantum device."""
-        if self.printlog:
+        printlog = self.printlog  # read once; checked at every step of the job
+        if printlog:
             print(f"{self.env.now:.2f}: {self.name} received Job {job_id} requiring {qubits_required} qubits. {self.container.level} qubits remains")
         
+        now = self.env.now
+
         # Log job start processing
         self.job_records_manager.log_job_event(job_id, 'devc_name', self.name)
-        self.job_records_manager.log_job_event(job_id, 'qpu_arrive', round(self.env.now,4))
+        self.job_records_manager.log_job_event(job_id, 'qpu_arrive', now)
         
         # Publish a 'device_start' event
-        self.event_bus.publish("device_start", {
-            "device": self.name,
-            "job_id": job_id,
-            "timestamp": round(self.env.now, 2),
-        })
+        payload = self._start_tmpl.copy()
+        payload["job_id"] = job_id
+        payload["timestamp"] = now
+        self.event_bus.publish("device_start", payload)
             
         selected_vertices = select_vertices_fast(self, qubits_required, job_id)
         
     
         while selected_vertices is None or self.maint_lock:
-            if self.printlog:
+            if printlog:
                 print(f"{self.env.now:.2f}: Job {job_id} is waiting for {self.name}.")
-            yield self.env.timeout(1)  # Wait before retrying
+            yield self.release_event  # Wait until qubits are released or maintenance ends
             selected_vertices = select_vertices_fast(self, qubits_required, job_id)
         
         
         self.job_records_manager.log_job_event(job_id, 'qpu_units', qubits_required)
-        yield self.container.get(qubits_required)
+        # Container requests take effect as soon as they are created when the level allows;
+        # the process only suspends on them when it actually has to wait
+        request = self.container.get(qubits_required)
+        if not request.triggered:
+            yield request
         remove_connectivity(self, selected_vertices, 'red')
        
         process_time = self.calculate_process_time(job)
         # (This is taken care of in broker. We don't need the following line anymore)
         # self.job_records_manager.log_job_event(job_id, 'qpu_start', round(self.env.now,4))
-        if self.printlog:
+        if printlog:
             print(f"{self.env.now:.2f}: Job {job_id} will take {process_time:.4f} sim-mins on {self.name}.")
         
         yield self.env.timeout(process_time)
@@ -234,27 +329,44 @@ class QuantumDevice(BaseQDevice):
         
         
         # Publish a 'device_finish' event
-        self.event_bus.publish("device_finish", {
+        payload = self._finish_tmpl.copy()
+        payload["job_id"] = job_id
+        payload["timestamp"] = self.env.now
+        self.event_bus.publish("device_finish", payload)
+        
+        release = self.container.put(qubits_required)
+        if not release.triggered:
+            yield release
+        reconnect_nodes(self, selected_vertices)
+        self._signal_release()
+
+        # Wake brokers waiting for QPU capacity
+        self.event_bus.publish("capacity_released", {
             "device": self.name,
-            "job_id": job_id,
-            "timestamp": round(self.env.now, 2),
+            "type": self.type,
         })
-        
-        yield self.container.put(qubits_required)
-        reconnect_nodes(self, selected_vertices)
-        if self.printlog:
+        if printlog:
             print(f"{self.env.now:.2f}: Job {job_id} completed on {self.name}.")
     
     def estimate_fidelity(self, job):
         pass
             
+# Calibration CSV columns read by IBM_QuantumDevice.extract_errors_from_csv
+CALIBRATION_COLUMNS = ("Readout assignment error", "RX error", "Pauli-X error", "CZ error")
+
 class IBM_QuantumDevice(QuantumDevice):
     """
     A base class for IBM quantum devices that defines common attributes.
     """
 
+    __slots__ = ("clops", "qvol", "median_T1", "median_T2", "processor_type", "cali_filepath",
+                 "_cal", "_rx_err", "_x_err", "_time_coeff", "_one_minus_rx", "_one_minus_readout")
+
+    # Parsed calibration data shared across devices, keyed by calibration file path
+    _calibration_cache = {}
+
     def __init__(self, name, nodes_file_name, pos_file_name, env, maintenance_interval, maintenance_duration, maintenance_switch, clops, qvol, median_T1, median_T2, processor_type, cali_filepath=None, printlog=True):
-        super().__init__(name, nodes_file_name, pos_file_name, env, maintenance_interval, maintenance_duration, maintenance_switch, printlog)
+        super().__init__(name, nodes_file_name, pos_file_name, env, maintenance_interval, maintenance_duration, maintenance_switch, printlog=printlog)
         
         # IBM-specific attributes
         self.clops = clops  # Circuit Layer Operations Per Second
@@ -263,19 +375,46 @@ class IBM_QuantumDevice(QuantumDevice):
         self.median_T2 = median_T2  # Median T2 time in microseconds
         self.processor_type = processor_type  # Type of quantum processor
         self.cali_filepath = cali_filepath # Calibration file path
+        # Per-shot processing time, M * K * log2(qvol) / clops / 60 with M = 100, K = 10
+        self._time_coeff = 100 * 10 * math.log2(qvol) / clops / 60
         self.printlog = printlog
-        self.readout_errors, self.single_qubit_gate_errors, self.two_qubit_gate_errors = self.extract_errors_from_csv()
+        # Calibration data is read on first use (see _load_calibration)
+        self._cal = None
+
+    def _load_calibration(self):
+        """
+        Read the calibration file and precompute the fidelity factors used by estimate_fidelity.
+
+        Returns:
+        - Tuple of (readout_errors, single_qubit_gate_errors, two_qubit_gate_errors).
+        """
+        self._cal = self.extract_errors_from_csv()
+        readout_errors, single_qubit_gate_errors, _ = self._cal
+        self._rx_err = single_qubit_gate_errors["rx"]
+        self._x_err = single_qubit_gate_errors["x"]
+
+        # Calibration is fixed, so the per-qubit fidelity factors are too
+        self._one_minus_rx = 1 - self._rx_err
+        self._one_minus_readout = 1 - float(readout_errors.mean())
+        return self._cal
+
+    @property
+    def readout_errors(self):
+        return (self._cal or self._load_calibration())[0]
+
+    @property
+    def single_qubit_gate_errors(self):
+        return (self._cal or self._load_calibration())[1]
+
+    @property
+    def two_qubit_gate_errors(self):
+        return (self._cal or self._load_calibration())[2]
 
     def calculate_process_time(self, job):
         """
         Calculate processing time considering IBM-specific metrics.
         """
-        M = 100
-        K = 10
-        S = job.num_shots
-        D = math.log2(self.qvol)
-
-        return  M * K * S * D / self.clops / 60
+        return job.num_shots * self._time_coeff
     
     def extract_errors_from_csv(self):
         """
@@ -286,22 +425,28 @@ class IBM_QuantumDevice(QuantumDevice):
             self.cali_filepath = 'HybridCloud/calibration/ibm_fez_calibrations_2025-01-13T16_54_24Z.csv'
             
         file_path = self.cali_filepath
-        calibration_data = pd.read_csv(file_path)
-        calibration_data.columns = calibration_data.columns.str.strip()
-
-        readout_errors = calibration_data["Readout assignment error"].tolist()
-        single_qubit_gate_errors = {
-            "rx": calibration_data["RX error"].mean(),
-            "x": calibration_data["Pauli-X error"].mean(),
-        }
-        two_qubit_gate_errors = {}
-        for cz_errors in calibration_data["CZ error"]:
-            pairs = cz_errors.split(";")
-            for pair in pairs:
-                gate, error = pair.split(":")
-                two_qubit_gate_errors[gate] = float(error)
-
-        return readout_errors, single_qubit_gate_errors, two_qubit_gate_errors
+        cached = IBM_QuantumDevice._calibration_cache.get(file_path)
+        if cached is None:
+            # Header names carry trailing spaces, so columns are matched after stripping
+            calibration_data = pd.read_csv(file_path, engine='c',
+                                           usecols=lambda name: name.strip() in CALIBRATION_COLUMNS)
+            calibration_data.columns = calibration_data.columns.str.strip()
+
+            readout_errors = calibration_data["Readout assignment error"].to_numpy(dtype=np.float64)
+            single_qubit_gate_errors = {
+                "rx": float(calibration_data["RX error"].mean()),
+                "x": float(calibration_data["Pauli-X error"].mean()),
+            }
+            # "gate:error;gate:error" per row -> one (gate, error) row per pair
+            cz_pairs = calibration_data["CZ error"].str.split(";").explode().str.split(":", expand=True)
+            two_qubit_gate_errors = dict(zip(cz_pairs[0], cz_pairs[1].astype(float).tolist()))
+
+            cached = (readout_errors, single_qubit_gate_errors, two_qubit_gate_errors)
+            IBM_QuantumDevice._calibration_cache[file_path] = cached
+
+        # Each device gets its own containers; the parsed file is shared
+        readout_errors, single_qubit_gate_errors, two_qubit_gate_errors = cached
+        return readout_errors.copy(), dict(single_qubit_gate_errors), dict(two_qubit_gate_errors)
 
     def estimate_fidelity(self, job):
         """
@@ -309,387 +454,369 @@ class IBM_QuantumDevice(QuantumDevice):
         """
         num_qubits = job.num_qubits
         depth = job.depth
+        if self._cal is None:
+            self._load_calibration()
 
         # Estimate single-qubit gate fidelity
-        avg_single_qubit_error = self.single_qubit_gate_errors["rx"]
-        single_qubit_fidelity = (1 - avg_single_qubit_error) ** depth
+        single_qubit_fidelity = self._one_minus_rx ** depth
 
-        # Estimate readout fidelity
-        avg_readout_error = sum(self.readout_errors) / len(self.readout_errors)
-        readout_fidelity = (1 - avg_readout_error) ** num_qubits
+        # Estimate readout fidelity from the mean readout error
+        readout_fidelity = self._one_minus_readout ** num_qubits
 
         # Combined fidelity
         estimated_fidelity = single_qubit_fidelity * readout_fidelity
         self.job_records_manager.log_job_event(job.job_id, 'fidelity', round(estimated_fidelity,4))   
         return estimated_fidelity
     
-class IBM_guadalupe(IBM_QuantumDevice):
-    """
+# Constructor arguments for each IBM device, keyed by class name. Maintenance figures on the
+# 2025 machines are randomly assigned minutes; T1/T2 are medians in microseconds. Machines before
+# IBM_Marrakesh use placeholder clops/T1/T2 values that still need real data.
+IBM_DEVICE_SPECS = {
+    'IBM_guadalupe': dict(
+        nodes_file_name='IBM_guadalupe_nodes.json',
+        pos_file_name='IBM_guadalupe_pos.json',
+        maintenance_interval=100,
+        maintenance_duration=15,
+        maintenance_switch=False,
+        clops=1400,
+        qvol=32,
+        median_T1=80,
+        median_T2=120,
+        processor_type="superconducting",
+    ),
+    'IBM_tokyo': dict(
+        nodes_file_name='IBM_tokyo_nodes.json',
+        pos_file_name='IBM_tokyo_pos.json',
+        maintenance_interval=120,
+        maintenance_duration=15,
+        maintenance_switch=False,
+        clops=1400,
+        qvol=32,
+        median_T1=80,
+        median_T2=120,
+        processor_type="superconducting",
+    ),
+    'IBM_montreal': dict(
+        nodes_file_name='IBM_montreal_nodes.json',
+        pos_file_name='IBM_montreal_pos.json',
+        maintenance_interval=140,
+        maintenance_duration=25,
+        maintenance_switch=False,
+        clops=1400,
+        qvol=32,
+        median_T1=80,
+        median_T2=120,
+        processor_type="superconducting",
+    ),
+    'IBM_rochester': dict(
+        nodes_file_name='IBM_rochester_nodes.json',
+        pos_file_name='IBM_rochester_pos.json',
+        maintenance_interval=140,
+        maintenance_duration=25,
+        maintenance_switch=False,
+        clops=1400,
+        qvol=32,
+        median_T1=80,
+        median_T2=120,
+        processor_type="superconducting",
+    ),
+    'IBM_hummingbird': dict(
+        nodes_file_name='IBM_hummingbird_nodes.json',
+        pos_file_name='IBM_hummingbird_pos.json',
+        maintenance_interval=140,
+        maintenance_duration=25,
+        maintenance_switch=False,
+        clops=1400,
+        qvol=128,
+        median_T1=80,
+        median_T2=120,
+        processor_type="superconducting",
+    ),
+    'IBM_Marrakesh': dict(
+        nodes_file_name='IBM_heron_r2_nodes.json',
+        pos_file_name='IBM_heron_r2_pos.json',
+        maintenance_interval=180,
+        maintenance_duration=40,
+        maintenance_switch=False,
+        clops=195000,
+        qvol=128,
+        median_T1=163.59,
+        median_T2=108.55,
+        processor_type="Heron r2",
+    ),
+    'IBM_Fez': dict(
+        nodes_file_name='IBM_heron_r2_nodes.json',
+        pos_file_name='IBM_heron_r2_pos.json',
+        maintenance_interval=120,
+        maintenance_duration=60,
+        maintenance_switch=False,
+        clops=195000,
+        qvol=128,
+        median_T1=110.89,
+        median_T2=91.27,
+        processor_type="Heron r2",
+    ),
+    'IBM_Torino': dict(
+        nodes_file_name='IBM_heron_r1_nodes.json',
+        pos_file_name='IBM_heron_r1_pos.json',
+        maintenance_interval=150,
+        maintenance_duration=45,
+        maintenance_switch=False,
+        clops=210000,
+        qvol=128,
+        median_T1=170.21,
+        median_T2=134.5,
+        processor_type="Heron r1",
+    ),
+    'IBM_Quebec': dict(
+        nodes_file_name='IBM_eagle_r3_nodes.json',
+        pos_file_name='IBM_eagle_r3_pos.json',
+        maintenance_interval=150,
+        maintenance_duration=45,
+        maintenance_switch=False,
+        clops=32000,
+        qvol=128,
+        median_T1=299.8,
+        median_T2=209.3,
+        processor_type="Eagle r3",
+    ),
+    'IBM_Kyiv': dict(
+        nodes_file_name='IBM_eagle_r3_nodes.json',
+        pos_file_name='IBM_eagle_r3_pos.json',
+        maintenance_interval=160,
+        maintenance_duration=40,
+        maintenance_switch=False,
+        clops=30000,
+        qvol=128,
+        median_T1=185.7,
+        median_T2=146.38,
+        processor_type="Eagle r3",
+    ),
+    'IBM_Brisbane': dict(
+        nodes_file_name='IBM_eagle_r3_nodes.json',
+        pos_file_name='IBM_eagle_r3_pos.json',
+        maintenance_interval=180,
+        maintenance_duration=60,
+        maintenance_switch=False,
+        clops=180000,
+        qvol=128,
+        median_T1=212.07,
+        median_T2=124.65,
+        processor_type="Eagle r3",
+    ),
+    'IBM_Sherbrooke': dict(
+        nodes_file_name='IBM_eagle_r3_nodes.json',
+        pos_file_name='IBM_eagle_r3_pos.json',
+        maintenance_interval=120,
+        maintenance_duration=40,
+        maintenance_switch=False,
+        clops=30000,
+        qvol=128,
+        median_T1=269.72,
+        median_T2=159.98,
+        processor_type="Eagle r3",
+    ),
+    'IBM_Kawasaki': dict(
+        nodes_file_name='IBM_eagle_r3_nodes.json',
+        pos_file_name='IBM_eagle_r3_pos.json',
+        maintenance_interval=140,
+        maintenance_duration=40,
+        maintenance_switch=False,
+        clops=29000,
+        qvol=128,
+        median_T1=185.7,
+        median_T2=146.38,
+        processor_type="Eagle r3",
+    ),
+    'IBM_Rensselaer': dict(
+        nodes_file_name='IBM_eagle_r3_nodes.json',
+        pos_file_name='IBM_eagle_r3_pos.json',
+        maintenance_interval=120,
+        maintenance_duration=30,
+        maintenance_switch=False,
+        clops=32000,
+        qvol=128,
+        median_T1=232.22,
+        median_T2=158.19,
+        processor_type="Eagle r3",
+    ),
+    'IBM_Brussels': dict(
+        nodes_file_name='IBM_eagle_r3_nodes.json',
+        pos_file_name='IBM_eagle_r3_pos.json',
+        maintenance_interval=160,
+        maintenance_duration=40,
+        maintenance_switch=False,
+        clops=220000,
+        qvol=128,
+        median_T1=308.18,
+        median_T2=177.36,
+        processor_type="Eagle r3",
+    ),
+    'IBM_Strasbourg': dict(
+        nodes_file_name='IBM_eagle_r3_nodes.json',
+        pos_file_name='IBM_eagle_r3_pos.json',
+        maintenance_interval=180,
+        maintenance_duration=60,
+        maintenance_switch=False,
+        clops=220000,
+        qvol=128,
+        median_T1=280.84,
+        median_T2=143.8,
+        processor_type="Eagle r3",
+    ),
+}
+
+def make_ibm_device(kind, env, name=None, printlog=True):
+    """
+    Build an IBM device from IBM_DEVICE_SPECS.
+
+    Parameters:
+    - kind: Key into IBM_DEVICE_SPECS, e.g. 'IBM_Fez'.
+    - env: SimPy environment, or None to assign one later.
+    - name: Device name; defaults to kind.
+    - printlog: Whether to print device logs.
+    """
+    return IBM_DEVICE_CLASSES[kind](env, name=name, printlog=printlog)
+
+
+def _device_class(kind, base, spec, doc):
+    # One thin subclass per spec keeps the device names usable for construction and isinstance checks
+    def __init__(self, env, name=None, printlog=True):
+        base.__init__(self, name=name if name else kind, env=env, printlog=printlog, **spec)
+    return type(kind, (base,), {
+        "__slots__": (),
+        "__init__": __init__,
+        "__doc__": doc,
+        "__module__": __name__,
+    })
+
+_IBM_DEVICE_DOCS = {
+    'IBM_guadalupe': """
     IBM Guadalupe is one of IBM's quantum processors based on superconducting qubits.
     Source: https://quantum-computing.ibm.com/
-    """
-    def __init__(self, env, name=None, printlog=True):
+    """,
 
-        super().__init__(name = name if name else __class__.__name__ , 
-                         nodes_file_name = 'IBM_guadalupe_nodes.json', 
-                         pos_file_name = 'IBM_guadalupe_pos.json', 
-                         env = env, 
-                         maintenance_interval = 100, 
-                         maintenance_duration = 15, 
-                         maintenance_switch = False, 
-                         clops=1400,  # Example value, need to update real data
-                         qvol = 32,
-                         median_T1=80,  # Example value in microseconds, need to update real data
-                         median_T2=120,  # Example value in microseconds, need to update real data
-                         processor_type="superconducting",
-                         printlog=printlog)       
-        
-        
-               
-class IBM_tokyo(IBM_QuantumDevice):
-    """
+    'IBM_tokyo': """
     IBM Tokyo is part of IBM's fleet of quantum processors. 
     It has been used for collaborative research with academic and industrial partners.
     Source: https://quantum-computing.ibm.com/
-    """
-    def __init__(self, env, name=None, printlog=True):   
-        
-        super().__init__(name = name if name else __class__.__name__ , 
-                         nodes_file_name = 'IBM_tokyo_nodes.json', 
-                         pos_file_name = 'IBM_tokyo_pos.json', 
-                         env = env, 
-                         maintenance_interval = 120, 
-                         maintenance_duration = 15, 
-                         maintenance_switch = False,
-                         clops=1400,  # Example value, need to update real data
-                         qvol = 32,
-                         median_T1=80,  # Example value in microseconds, need to update real data
-                         median_T2=120,  # Example value in microseconds, need to update real data
-                         processor_type="superconducting",
-                         printlog=printlog)       
-
-                      
-        
-                
-class IBM_montreal(IBM_QuantumDevice): 
-    """
+    """,
+
+    'IBM_montreal': """
     IBM Montreal is a superconducting qubit-based quantum processor.
     Source: https://quantum-computing.ibm.com/
-    """
-    def __init__(self, env, name=None, printlog=True):    
-                
-        super().__init__(name = name if name else __class__.__name__ , 
-                         nodes_file_name = 'IBM_montreal_nodes.json', 
-                         pos_file_name = 'IBM_montreal_pos.json', 
-                         env = env, 
-                         maintenance_interval = 140, 
-                         maintenance_duration = 25, 
-                         maintenance_switch = False,
-                         clops=1400,  # Example value, need to update real data
-                         qvol = 32,
-                         median_T1=80,  # Example value in microseconds, need to update real data
-                         median_T2=120,  # Example value in microseconds, need to update real data
-                         processor_type="superconducting",
-                         printlog=printlog)       
-        
-   
-           
-class IBM_rochester(IBM_QuantumDevice):
-    """
+    """,
+
+    'IBM_rochester': """
     IBM Rochester is one of the early quantum processors from IBM, 
     named after the city of Rochester, New York, where IBM has a 
     significant presence. It is primarily used for foundational 
     research in quantum computing and testing new quantum algorithms.
     Source: https://quantum-computing.ibm.com/
-    """
-    def __init__(self, env, name=None, printlog=True):    
-        
-        super().__init__(name = name if name else __class__.__name__ , 
-                         nodes_file_name = 'IBM_rochester_nodes.json', 
-                         pos_file_name = 'IBM_rochester_pos.json', 
-                         env = env, 
-                         maintenance_interval = 140, 
-                         maintenance_duration = 25, 
-                         maintenance_switch = False,
-                         clops=1400,  # Example value, need to update real data
-                         qvol = 32,
-                         median_T1=80,  # Example value in microseconds, need to update real data
-                         median_T2=120,  # Example value in microseconds, need to update real data
-                         processor_type="superconducting",
-                         printlog=printlog)       
-  
-        
-        
-class IBM_hummingbird(IBM_QuantumDevice):
-    """
+    """,
+
+    'IBM_hummingbird': """
     IBM Hummingbird is a more advanced quantum processor, part of IBM's effort to scale up quantum computing capabilities significantly. It is designed for more complex quantum computations, exploring error correction techniques, and scaling towards practical quantum advantage.
     Source: https://quantum-computing.ibm.com/
-    """
-    def __init__(self, env, name=None, printlog=True):
+    """,
 
-        super().__init__(name = name if name else __class__.__name__ , 
-                         nodes_file_name = 'IBM_hummingbird_nodes.json', 
-                         pos_file_name = 'IBM_hummingbird_pos.json', 
-                         env = env, 
-                         maintenance_interval = 140, 
-                         maintenance_duration = 25, 
-                         maintenance_switch = False,
-                         clops=1400,  # Example value, need to update real data
-                         qvol = 128, # https://docs.quantum.ibm.com/guides/processor-types
-                         median_T1=80,  # Example value in microseconds, need to update real data
-                         median_T2=120,  # Example value in microseconds, need to update real data
-                         processor_type="superconducting",
-                         printlog=printlog)                   
-
-### IBM machines that are online as of 01-26-2025        
-        
-class IBM_Marrakesh(IBM_QuantumDevice):
-    """
+    'IBM_Marrakesh': """
     Source: https://quantum.ibm.com/services/resources
-    """
-    def __init__(self, env, name=None, printlog=True):     
-                
-        super().__init__(name = name if name else __class__.__name__ , 
-                         nodes_file_name = 'IBM_heron_r2_nodes.json', 
-                         pos_file_name = 'IBM_heron_r2_pos.json', 
-                         env = env, 
-                         maintenance_interval = 180, # randomly assigned minutes 
-                         maintenance_duration = 40, # randomly assigned minutes 
-                         maintenance_switch = False,
-                         clops=195000,  # updated real data on 01-26-2025
-                         qvol = 128, # https://docs.quantum.ibm.com/guides/processor-types
-                         median_T1=163.59,  # in microseconds, updated real data on 12-8-2024
-                         median_T2=108.55,  # in microseconds, updated real data on 12-8-2024
-                         processor_type="Heron r2",
-                         printlog=printlog)      
+    """,
 
-        
-        
-class IBM_Fez(IBM_QuantumDevice):
-    """
+    'IBM_Fez': """
     Source: https://quantum.ibm.com/services/resources
-    """
-    def __init__(self, env, name=None, printlog=True):     
-                
-        super().__init__(name = name if name else __class__.__name__ , 
-                         nodes_file_name = 'IBM_heron_r2_nodes.json', 
-                         pos_file_name = 'IBM_heron_r2_pos.json', 
-                         env = env, 
-                         maintenance_interval = 120, # randomly assigned minutes 
-                         maintenance_duration = 60, # randomly assigned minutes 
-                         maintenance_switch = False,
-                         clops=195000,  # updated real data on 01-26-2025
-                         qvol = 128, # https://docs.quantum.ibm.com/guides/processor-types
-                         median_T1=110.89,  # in microseconds, updated real data on 12-8-2024
-                         median_T2=91.27,  # in microseconds, updated real data on 12-8-2024
-                         processor_type="Heron r2",
-                         printlog=printlog)              
-
-        
+    """,
 
-class IBM_Torino(IBM_QuantumDevice):
-    """
+    'IBM_Torino': """
     Source: https://quantum.ibm.com/services/resources
-    """
-    def __init__(self, env, name=None, printlog=True):     
-                
-        super().__init__(name = name if name else __class__.__name__ , 
-                         nodes_file_name = 'IBM_heron_r1_nodes.json', 
-                         pos_file_name = 'IBM_heron_r1_pos.json', 
-                         env = env, 
-                         maintenance_interval = 150, # randomly assigned minutes
-                         maintenance_duration = 45, # randomly assigned minutes
-                         maintenance_switch = False,
-                         clops=210000,  # updated real data on 01-26-2025
-                         qvol = 128, # https://docs.quantum.ibm.com/guides/processor-types
-                         median_T1=170.21,  # in microseconds, updated real data on 12-8-2024
-                         median_T2=134.5,  # in microseconds, updated real data on 12-8-2024
-                         processor_type="Heron r1",
-                         printlog=printlog)                
+    """,
 
-        
-        
-class IBM_Quebec(IBM_QuantumDevice):
-    """
+    'IBM_Quebec': """
     Source: https://quantum.ibm.com/services/resources
-    """
-    def __init__(self, env, name=None, printlog=True):     
-                
-        super().__init__(name = name if name else __class__.__name__ , 
-                         nodes_file_name = 'IBM_eagle_r3_nodes.json', 
-                         pos_file_name = 'IBM_eagle_r3_pos.json', 
-                         env = env, 
-                         maintenance_interval = 150, # randomly assigned minutes
-                         maintenance_duration = 45, # randomly assigned minutes
-                         maintenance_switch = False,
-                         clops=32000,  # updated real data on 01-26-2025
-                         qvol = 128, # https://docs.quantum.ibm.com/guides/processor-types
-                         median_T1=299.8,  # in microseconds, updated real data on 12-8-2024
-                         median_T2=209.3,  # in microseconds, updated real data on 12-8-2024
-                         processor_type="Eagle r3",
-                         printlog=printlog)     
+    """,
 
-        
-        
-
-class IBM_Kyiv(IBM_QuantumDevice):
-    """
+    'IBM_Kyiv': """
     Source: https://quantum.ibm.com/services/resources
-    """
-    def __init__(self, env, name=None, printlog=True):     
-                
-        super().__init__(name = name if name else __class__.__name__ , 
-                         nodes_file_name = 'IBM_eagle_r3_nodes.json', 
-                         pos_file_name = 'IBM_eagle_r3_pos.json', 
-                         env = env, 
-                         maintenance_interval = 160, # randomly assigned minutes
-                         maintenance_duration = 40, # randomly assigned minutes
-                         maintenance_switch = False,
-                         clops=30000,  # updated real data on 01-26-2025
-                         qvol = 128, # https://docs.quantum.ibm.com/guides/processor-types
-                         median_T1=185.7,  # in microseconds, updated real data on 12-8-2024
-                         median_T2=146.38,  # in microseconds, updated real data on 12-8-2024
-                         processor_type="Eagle r3",
-                         printlog=printlog)    
-        
-        
-        
-class IBM_Brisbane(IBM_QuantumDevice):
-    """
+    """,
+
+    'IBM_Brisbane': """
     Source: https://quantum.ibm.com/services/resources
-    """
-    def __init__(self, env, name=None, printlog=True):     
-                
-        super().__init__(name = name if name else __class__.__name__ , 
-                         nodes_file_name = 'IBM_eagle_r3_nodes.json', 
-                         pos_file_name = 'IBM_eagle_r3_pos.json', 
-                         env = env, 
-                         maintenance_interval = 180, # randomly assigned minutes
-                         maintenance_duration = 60, # randomly assigned minutes
-                         maintenance_switch = False,
-                         clops=180000,  # updated real data on 01-26-2025
-                         qvol = 128, # https://docs.quantum.ibm.com/guides/processor-types
-                         median_T1=212.07,  # in microseconds, updated real data on 12-8-2024
-                         median_T2=124.65,  # in microseconds, updated real data on 12-8-2024
-                         processor_type="Eagle r3",
-                         printlog=printlog)    
+    """,
 
-        
-        
-        
-class IBM_Sherbrooke(IBM_QuantumDevice):
-    """
+    'IBM_Sherbrooke': """
     Source: https://quantum.ibm.com/services/resources
-    """
-    def __init__(self, env, name=None, printlog=True):     
-                
-        super().__init__(name = name if name else __class__.__name__ , 
-                         nodes_file_name = 'IBM_eagle_r3_nodes.json', 
-                         pos_file_name = 'IBM_eagle_r3_pos.json', 
-                         env = env, 
-                         maintenance_interval = 120, # randomly assigned minutes
-                         maintenance_duration = 40, # randomly assigned minutes
-                         maintenance_switch = False,
-                         clops=30000,  # updated real data on 01-26-2025
-                         qvol = 128, # https://docs.quantum.ibm.com/guides/processor-types
-                         median_T1=269.72,  # in microseconds, updated real data on 12-8-2024
-                         median_T2=159.98,  # in microseconds, updated real data on 12-8-2024
-                         processor_type="Eagle r3",
-                         printlog=printlog)    
-        
-        
-        
-        
-class IBM_Kawasaki(IBM_QuantumDevice):
-    """
+    """,
+
+    'IBM_Kawasaki': """
     Source: https://quantum.ibm.com/services/resources
-    """
-    def __init__(self, env, name=None, printlog=True):     
-                
-        super().__init__(name = name if name else __class__.__name__ , 
-                         nodes_file_name = 'IBM_eagle_r3_nodes.json', 
-                         pos_file_name = 'IBM_eagle_r3_pos.json', 
-                         env = env, 
-                         maintenance_interval = 140, # randomly assigned minutes
-                         maintenance_duration = 40, # randomly assigned minutes
-                         maintenance_switch = False,
-                         clops=29000,  # updated real data on 01-26-2025
-                         qvol = 128, # https://docs.quantum.ibm.com/guides/processor-types
-                         median_T1=185.7,  # in microseconds, updated real data on 12-8-2024
-                         median_T2=146.38,  # in microseconds, updated real data on 12-8-2024
-                         processor_type="Eagle r3",
-                         printlog=printlog)    
-        
-         
-        
-class IBM_Rensselaer(IBM_QuantumDevice):
-    """
+    """,
+
+    'IBM_Rensselaer': """
     Source: https://quantum.ibm.com/services/resources
-    """
-    def __init__(self, env, name=None, printlog=True):     
-                
-        super().__init__(name = name if name else __class__.__name__ , 
-                         nodes_file_name = 'IBM_eagle_r3_nodes.json', 
-                         pos_file_name = 'IBM_eagle_r3_pos.json', 
-                         env = env, 
-                         maintenance_interval = 120, # randomly assigned minutes
-                         maintenance_duration = 30, # randomly assigned minutes
-                         maintenance_switch = False,
-                         clops=32000,  # updated real data on 01-26-2025
-                         qvol = 128, # https://docs.quantum.ibm.com/guides/processor-types
-                         median_T1=232.22,  # in microseconds, updated real data on 12-8-2024
-                         median_T2=158.19,  # in microseconds, updated real data on 12-8-2024
-                         processor_type="Eagle r3",
-                         printlog=printlog)    
-        
-        
+    """,
 
-class IBM_Brussels(IBM_QuantumDevice):
-    """
+    'IBM_Brussels': """
     Source: https://quantum.ibm.com/services/resources
-    """
-    def __init__(self, env, name=None, printlog=True):     
-                
-        super().__init__(name = name if name else __class__.__name__ , 
-                         nodes_file_name = 'IBM_eagle_r3_nodes.json', 
-                         pos_file_name = 'IBM_eagle_r3_pos.json', 
-                         env = env, 
-                         maintenance_interval = 160, # randomly assigned minutes
-                         maintenance_duration = 40, # randomly assigned minutes
-                         maintenance_switch = False,
-                         clops=220000,  # updated real data on 01-26-2025
-                         qvol = 128, # https://docs.quantum.ibm.com/guides/processor-types
-                         median_T1=308.18,  # in microseconds, updated real data on 12-8-2024
-                         median_T2=177.36,  # in microseconds, updated real data on 12-8-2024
-                         processor_type="Eagle r3",
-                         printlog=printlog)    
-        
-        
-        
-class IBM_Strasbourg(IBM_QuantumDevice):
-    """
+    """,
+
+    'IBM_Strasbourg': """
     Source: https://quantum.ibm.com/services/resources
-    """
-    def __init__(self, env, name=None, printlog=True):     
-                
-        super().__init__(name = name if name else __class__.__name__ , 
-                         nodes_file_name = 'IBM_eagle_r3_nodes.json', 
-                         pos_file_name = 'IBM_eagle_r3_pos.json', 
-                         env = env, 
-                         maintenance_interval = 180, # randomly assigned minutes
-                         maintenance_duration = 60, # randomly assigned minutes
-                         maintenance_switch = False,
-                         clops=220000,  # updated real data on 01-26-2025
-                         qvol = 128, # https://docs.quantum.ibm.com/guides/processor-types
-                         median_T1=280.84,  # in microseconds, updated real data on 12-8-2024
-                         median_T2=143.8,  # in microseconds, updated real data on 12-8-2024
-                         processor_type="Eagle r3",
-                         printlog=printlog)    
-        
-        
-        
-class Amazon_dwave(QuantumDevice):
-    """
+    """,
+}
+
+IBM_DEVICE_CLASSES = {kind: _device_class(kind, IBM_QuantumDevice, spec, _IBM_DEVICE_DOCS[kind]) for kind, spec in IBM_DEVICE_SPECS.items()}
+globals().update(IBM_DEVICE_CLASSES)
+
+
+# Constructor arguments for the non-IBM devices, keyed by class name
+DEVICE_SPECS = {
+    'Amazon_dwave': dict(
+        nodes_file_name='Amazon_dwave_nodes.json',
+        pos_file_name='Amazon_dwave_pos.json',
+        maintenance_interval=140,
+        maintenance_duration=25,
+        maintenance_switch=False,
+    ),
+    'Chimera_dwave_72': dict(
+        nodes_file_name='Chimera_dwave_72_nodes.json',
+        pos_file_name='Chimera_dwave_72_pos.json',
+        maintenance_interval=200,
+        maintenance_duration=25,
+        maintenance_switch=False,
+    ),
+    'Chimera_dwave_128': dict(
+        nodes_file_name='Chimera_dwave_128_nodes.json',
+        pos_file_name='Chimera_dwave_128_pos.json',
+        maintenance_interval=250,
+        maintenance_duration=40,
+        maintenance_switch=False,
+    ),
+    'Amazon_rigetti': dict(
+        nodes_file_name='Amazon_rigetti_nodes.json',
+        pos_file_name='Amazon_rigetti_pos.json',
+        maintenance_interval=250,
+        maintenance_duration=40,
+        maintenance_switch=False,
+    ),
+    'Google_sycamore': dict(
+        nodes_file_name='Google_sycamore_nodes.json',
+        pos_file_name='Google_sycamore_pos.json',
+        maintenance_interval=150,
+        maintenance_duration=20,
+        maintenance_switch=False,
+    ),
+    'Google_sycamore_53': dict(
+        nodes_file_name='Google_sycamore_53_nodes.json',
+        pos_file_name='Google_sycamore_53_pos.json',
+        maintenance_interval=140,
+        maintenance_duration=25,
+        maintenance_switch=False,
+    ),
+}
+
+_DEVICE_DOCS = {
+    'Amazon_dwave': """
     The D-Wave QPU is a lattice of interconnected qubits. While some qubits connect to others via couplers, the D-Wave QPU is not fully connected. Instead, the qubits of D-Wave annealing quantum computers interconnect in one of the following topologies:
 
     Pegasus: 14-1026 Next-Generation Topology of D-Wave Quantum Processors
@@ -699,46 +826,18 @@ class Amazon_dwave(QuantumDevice):
     https://www.dwavesys.com/media/2uznec4s/14-1056a-a_zephyr_topology_of_d-wave_quantum_processors.pdf?_gl=1*sl9028*_gcl_au*NDI1MTIwMzY4LjE3MjI1NDgzNTk.*_ga*OTk3MzI5MzA0LjE3MjI1NDgzNTk.*_ga_DXNKH9HE3W*MTcyMjU3MDMwOC4yLjEuMTcyMjU3MDM3Ni42MC4wLjA.
 
     Source: https://docs.dwavesys.com/docs/latest/c_gs_4.html
-    """
-    def __init__(self, env, name=None, printlog=True):     
-        
-        super().__init__(name = name if name else __class__.__name__ , 
-                         nodes_file_name = 'Amazon_dwave_nodes.json', 
-                         pos_file_name = 'Amazon_dwave_pos.json', 
-                         env = env, 
-                         maintenance_interval = 140, 
-                         maintenance_duration = 25, 
-                         maintenance_switch = False,
-                         printlog=printlog)     
-        
-        
-        
-        
-class Chimera_dwave_72(QuantumDevice):
-    """
+    """,
+
+    'Chimera_dwave_72': """
     The Chimera topology is a specific layout of qubits used in D-Wave quantum annealers. It is designed to optimize the interconnectivity between qubits while maintaining a scalable and manufacturable architecture [1]. 
 
     Reference: [1] Ayanzadeh, Ramin & Mousavi, Ahmad & Halem, Milton & Finin, Tim. (2018). Quantum Annealing Based Binary Compressive Sensing with Matrix Uncertainty. 
 
     Source: https://www.researchgate.net/figure/Chimera-Topology-in-D-Wave-Quantum-Annealers_fig1_330102244
     
-    """
-    
-    def __init__(self, env, name=None, printlog=True):
+    """,
 
-        super().__init__(name = name if name else __class__.__name__ , 
-                         nodes_file_name = 'Chimera_dwave_72_nodes.json', 
-                         pos_file_name = 'Chimera_dwave_72_pos.json', 
-                         env = env, 
-                         maintenance_interval = 200, 
-                         maintenance_duration = 25, 
-                         maintenance_switch = False,
-                         printlog=printlog)     
-   
-  
-
-class Chimera_dwave_128(QuantumDevice):
-    """
+    'Chimera_dwave_128': """
 
     The Chimera topology is a specific layout of qubits used in D-Wave quantum annealers. It is designed to optimize the interconnectivity between qubits while maintaining a scalable and manufacturable architecture [1]. 
 
@@ -746,23 +845,9 @@ class Chimera_dwave_128(QuantumDevice):
 
     Source: https://www.researchgate.net/figure/Chimera-Topology-in-D-Wave-Quantum-Annealers_fig1_330102244
     
-    """
-    
-    def __init__(self, env, name=None, printlog=True):
+    """,
 
-        super().__init__(name = name if name else __class__.__name__ , 
-                         nodes_file_name = 'Chimera_dwave_128_nodes.json', 
-                         pos_file_name = 'Chimera_dwave_128_pos.json', 
-                         env = env, 
-                         maintenance_interval = 250, 
-                         maintenance_duration = 40, 
-                         maintenance_switch = False,
-                         printlog=printlog)     
-        
-        
-               
-class Amazon_rigetti(QuantumDevice):
-    """
+    'Amazon_rigetti': """
     The Rigetti quantum computer is one of the quantum processing units (QPUs) available through Amazon Braket, AWS's quantum computing service. The Rigetti QPUs use superconducting qubits, which are a popular choice for building quantum computers due to their scalability and relatively high coherence times. 
 
     References: 
@@ -770,22 +855,9 @@ class Amazon_rigetti(QuantumDevice):
     Rigetti Computing - Quantum Cloud Services https://docs.rigetti.com/qcs
     Amazon Braket – Go Hands-On with Quantum Computing https://aws.amazon.com/blogs/aws/amazon-braket-go-hands-on-with-quantum-computing/
 
-    """
-    def __init__(self, env, name=None, printlog=True):
+    """,
 
-        super().__init__(name = name if name else __class__.__name__ , 
-                         nodes_file_name = 'Amazon_rigetti_nodes.json', 
-                         pos_file_name = 'Amazon_rigetti_pos.json', 
-                         env = env, 
-                         maintenance_interval = 250, 
-                         maintenance_duration = 40, 
-                         maintenance_switch = False,
-                         printlog=printlog)     
-        
-        
-               
-class Google_sycamore(QuantumDevice):
-    """
+    'Google_sycamore': """
     The Sycamore quantum computer is a quantum processor developed by Google AI Quantum. The Sycamore processor uses superconducting qubits arranged in a two-dimensional grid. Each qubit is connected to four nearest neighbors, which allows for high connectivity and complex interactions needed for quantum computations.
 
     The processor utilizes a combination of single-qubit and two-qubit gates to perform quantum operations. The fidelity (accuracy) of these gates is crucial for the performance of the quantum computer, with single-qubit gate fidelities exceeding 99.9% and two-qubit gate fidelities around 99.4% [1].
@@ -795,22 +867,9 @@ class Google_sycamore(QuantumDevice):
     Reference: [1] AbuGhanem, M., Eleuch, H. Full quantum tomography study of Google’s Sycamore gate on IBM’s quantum computers. EPJ Quantum Technol. 11, 36 (2024). https://doi.org/10.1140/epjqt/s40507-024-00248-8
 
     Source: https://epjquantumtechnology.springeropen.com/articles/10.1140/epjqt/s40507-024-00248-8
-    """
-    
-    def __init__(self, env, name=None, printlog=True):
-
-        super().__init__(name = name if name else __class__.__name__ , 
-                         nodes_file_name = 'Google_sycamore_nodes.json', 
-                         pos_file_name = 'Google_sycamore_pos.json', 
-                         env = env, 
-                         maintenance_interval = 150, 
-                         maintenance_duration = 20, 
-                         maintenance_switch = False,
-                         printlog=printlog)    
-
+    """,
 
-class Google_sycamore_53(QuantumDevice):
-    """
+    'Google_sycamore_53': """
     The Sycamore 
     quantum computer is a quantum processor developed by Google AI Quantum. The Sycamore processor uses superconducting qubits arranged in a two-dimensional grid. Each qubit is connected to four nearest neighbors, which allows for high connectivity and complex interactions needed for quantum computations.
 
@@ -821,16 +880,23 @@ class Google_sycamore_53(QuantumDevice):
     Reference: [1] AbuGhanem, M., Eleuch, H. Full quantum tomography study of Google’s Sycamore gate on IBM’s quantum computers. EPJ Quantum Technol. 11, 36 (2024). https://doi.org/10.1140/epjqt/s40507-024-00248-8
 
     Source: https://epjquantumtechnology.springeropen.com/articles/10.1140/epjqt/s40507-024-00248-8
+    """,
+}
+
+# Every named device class, IBM included
+DEVICE_CLASSES = {kind: _device_class(kind, QuantumDevice, spec, _DEVICE_DOCS[kind]) for kind, spec in DEVICE_SPECS.items()}
+globals().update(DEVICE_CLASSES)
+DEVICE_CLASSES.update(IBM_DEVICE_CLASSES)
+
+
+def make_device(kind, env, name=None, printlog=True):
     """
-    
-    def __init__(self, env, name=None, printlog=True):
+    Build any named device from DEVICE_SPECS or IBM_DEVICE_SPECS.
 
-        super().__init__(name = name if name else __class__.__name__ , 
-                         nodes_file_name = 'Google_sycamore_53_nodes.json', 
-                         pos_file_name = 'Google_sycamore_53_pos.json', 
-                         env = env, 
-                         maintenance_interval = 140, 
-                         maintenance_duration = 25, 
-                         maintenance_switch = False,
-                         printlog=printlog)    
-        
\ No newline at end of file
+    Parameters:
+    - kind: Device class name, e.g. 'Google_sycamore' or 'IBM_Fez'.
+    - env: SimPy environment, or None to assign one later.
+    - name: Device name; defaults to kind.
+    - printlog: Whether to print device logs.
+    """
+    return DEVICE_CLASSES[kind](env, name=name, printlog=printlog)
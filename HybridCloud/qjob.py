@@ -3,6 +3,11 @@
 from .job import Job
 
 class QJob:
+    __slots__ = ("job_id", "circuit_name", "num_qubits", "depth", "num_shots", "gates",
+                 "expected_exec_time", "priority", "noise_model", "arrival_time", "iterations",
+                 "iteration", "cpu_units", "mem_bw",
+                 # set later by the broker / HPC devices
+                 "phase", "cpu_exec_time")
     
     def __init__(self, job_id,                 
                  num_qubits, 
@@ -14,7 +19,9 @@ class QJob:
                  circuit_name=None, 
                  gates=None, 
                  expected_exec_time=None, 
-                 noise_model=None):
+                 noise_model=None,
+                 cpu_units=8,
+                 mem_bw=20):
         
         """
         Initializes a QJob instance.
@@ -25,6 +32,8 @@ class QJob:
         - circuit_depth (int): The depth of the quantum circuit.
         - required_qubits (int): The number of qubits required.
         - qcloud (QCloud): Reference to the QCloud object for logging.
+        - cpu_units (int): CPU units requested for the classical phase.
+        - mem_bw (int): Memory bandwidth units requested for the classical phase.
         """
 
         self.job_id = job_id
@@ -38,20 +47,25 @@ class QJob:
         self.noise_model = noise_model
         self.arrival_time = arrival_time
         self.iterations = iterations
+        self.iteration = 0          # completed QPU/CPU rounds, advanced by the broker
+        self.cpu_units = int(cpu_units)
+        self.mem_bw = int(mem_bw)
         
 
     def __repr__(self):
         """
         Provides a string representation of the QJob object.
         """
-        return (f"QJob(job_id={self.job_id}, "
-                f"circuit_name={self.circuit_name}, "
-                f"num_qubits={self.num_qubits}, "
-                f"depth={self.depth}, "
-                f"gates={self.gates}, "
-                f"expected_exec_time={self.expected_exec_time}, "
-                f"priority={self.priority}, "
-                f"noise_model={self.noise_model}, "
-                f"arrival_time={self.arrival_time:.2f}, "
-                f"iterations={self.iterations}, "
-                f"num_shots={self.num_shots})")
\ No newline at end of file
+        return "".join((
+            "QJob(job_id=", str(self.job_id),
+            ", circuit_name=", str(self.circuit_name),
+            ", num_qubits=", str(self.num_qubits),
+            ", depth=", str(self.depth),
+            ", gates=", str(self.gates),
+            ", expected_exec_time=", str(self.expected_exec_time),
+            ", priority=", str(self.priority),
+            ", noise_model=", str(self.noise_model),
+            ", arrival_time=", format(self.arrival_time, ".2f"),
+            ", iterations=", str(self.iterations),
+            ", num_shots=", str(self.num_shots), ")",
+        ))
@@ -10,13 +10,23 @@ def _safe_list(row, key):
     v = row.get(key, [])
     return v if isinstance(v, list) else ([] if v is None else [v])
 
+# Per-iteration phase stamps shared by the Gantt chart and the phase metrics
+_PHASE_STAMPS = ('qpu_start', 'qpu_finish', 'cpu_start', 'cpu_finish')
+
+def _slices(row, keys):
+    # convert each key once and cut every list to the shortest one (defensive)
+    lists = [_safe_list(row, key) for key in keys]
+    n = min(len(l) for l in lists)
+    return n, [l[:n] for l in lists]
+
+def _stamp_count(row, key):
+    # length _safe_list would return, without building the list
+    v = row.get(key)
+    return len(v) if isinstance(v, list) else (0 if v is None else 1)
+
 def _iters(row):
     # number of iterations = min of available arrays (defensive)
-    n = min(len(_safe_list(row, 'qpu_start')),
-            len(_safe_list(row, 'qpu_finish')),
-            len(_safe_list(row, 'cpu_start')),
-            len(_safe_list(row, 'cpu_finish')))
-    return n
+    return min(_stamp_count(row, key) for key in _PHASE_STAMPS)
 
 def plot_gantt(job_records, DISPLAY, title="Hybrid QPU/CPU Timeline"):
     """
@@ -26,38 +36,39 @@ def plot_gantt(job_records, DISPLAY, title="Hybrid QPU/CPU Timeline"):
         print("No records to plot.")
         return
 
-    jobs = sorted(job_records.keys())
-    fig, ax = plt.subplots(figsize=(12, max(3, 0.6*len(jobs))))
+    # only jobs up to DISPLAY are drawn, so only those need sorting
+    jobs = sorted(job_id for job_id in job_records if job_id <= DISPLAY)
+    fig, ax = plt.subplots(figsize=(12, max(3, 0.6*len(job_records))))
 
     ytick, ylabels = [], []
+    labels = []  # (x, row, iteration, QPU span width) for the iteration labels
     colors = {"QPU": "#0496ff", "CPU": "#f25c54"}
 
     for idx, job_id in enumerate(jobs):
-        if job_id > DISPLAY:  # only first 10 jobs
-            break
-
         row = job_records[job_id]
-        n = _iters(row)
-        qs = _safe_list(row, 'qpu_start')[:n]
-        qf = _safe_list(row, 'qpu_finish')[:n]
-        cs = _safe_list(row, 'cpu_start')[:n]
-        cf = _safe_list(row, 'cpu_finish')[:n]
-
-        # draw spans
-        for i in range(n):
-            # QPU bar
-            ax.barh(idx, qf[i] - qs[i], left=qs[i], height=0.65,
-                    edgecolor='black', color=colors["QPU"], alpha=0.9)
-            ax.text(qs[i], idx , f" itr#{i}", fontsize=16, va='center', ha='left')
-
-            # CPU bar
-            ax.barh(idx, cf[i] - cs[i], left=cs[i], height=0.65,
-                    edgecolor='black', color=colors["CPU"], alpha=0.9)
-            ax.text(cs[i], idx , f"", fontsize=16, va='center', ha='left')
+        n, (qs, qf, cs, cf) = _slices(row, _PHASE_STAMPS)
+
+        # draw spans: one collection per resource per job
+        if n:
+            qs = np.asarray(qs, dtype=float)
+            cs = np.asarray(cs, dtype=float)
+            qw = np.asarray(qf, dtype=float) - qs
+            ax.broken_barh(np.column_stack([qs, qw]), (idx - 0.325, 0.65),
+                           edgecolors='black', facecolors=colors["QPU"], alpha=0.9)
+            ax.broken_barh(np.column_stack([cs, np.asarray(cf, dtype=float) - cs]), (idx - 0.325, 0.65),
+                           edgecolors='black', facecolors=colors["CPU"], alpha=0.9)
+            labels.extend(zip(qs.tolist(), [idx] * n, range(n), qw.tolist()))
 
         ytick.append(idx)
         ylabels.append(f"Job {job_id}")
 
+    # label only QPU spans wider than 1% of the x-range; narrower ones would be unreadable anyway
+    x_lo, x_hi = ax.get_xlim()
+    min_width = 0.01 * (x_hi - x_lo)
+    for x, row_idx, i, width in labels:
+        if width > min_width:
+            ax.text(x, row_idx, f" itr#{i}", fontsize=16, va='center', ha='left')
+
     ax.set_yticks(ytick)
     ax.set_yticklabels(ylabels, fontsize=20)
     ax.set_xlabel("Sim time", fontsize=20)
@@ -75,49 +86,84 @@ def plot_gantt(job_records, DISPLAY, title="Hybrid QPU/CPU Timeline"):
     fig.tight_layout()
     plt.show()
 
-def print_phase_metrics(job_records, DISPLAY):
+def print_phase_metrics(job_records, DISPLAY, PRINT=False):
     """
     Prints wait / service / turnaround per phase & iteration.
     wait   = start - arrive
     svc    = finish - start
     turn   = finish - arrive
+
+    Printing is off by default (PRINT=False), in which case nothing is computed.
     """
-    for job_id in sorted(job_records.keys()):
- 
-        if job_id > DISPLAY: 
-            break
+    if not PRINT:
+        return
+
+    for job_id in sorted(job_id for job_id in job_records if job_id <= DISPLAY):
         row = job_records[job_id]
-        n = _iters(row)
+        n, (qs, qf, cs, cf) = _slices(row, _PHASE_STAMPS)
         if n == 0:
             continue
 
         qa = _safe_list(row, 'qpu_arrive')[:n]
-        qs = _safe_list(row, 'qpu_start')[:n]
-        qf = _safe_list(row, 'qpu_finish')[:n]
         ca = _safe_list(row, 'cpu_arrive')[:n]
-        cs = _safe_list(row, 'cpu_start')[:n]
-        cf = _safe_list(row, 'cpu_finish')[:n]
-        
-        if not True: 
-            print(f"\nJob {job_id} (iterations={n}):")
-            for i in range(n):
-                q_wait = round(qs[i] - qa[i], 4)
-                q_svc  = round(qf[i] - qs[i], 4)
-                q_turn = round(qf[i] - qa[i], 4)
 
-                c_wait = round(cs[i] - ca[i], 4)
-                c_svc  = round(cf[i] - cs[i], 4)
-                c_turn = round(cf[i] - ca[i], 4)
+        print(f"\nJob {job_id} (iterations={n}):")
+        for i in range(n):
+            q_wait = round(qs[i] - qa[i], 4)
+            q_svc  = round(qf[i] - qs[i], 4)
+            q_turn = round(qf[i] - qa[i], 4)
 
-                print(f"  iter {i}: "
-                      f"QPU[wait={q_wait}, svc={q_svc}, turn={q_turn}]  |  "
-                      f"CPU[wait={c_wait}, svc={c_svc}, turn={c_turn}]")
+            c_wait = round(cs[i] - ca[i], 4)
+            c_svc  = round(cf[i] - cs[i], 4)
+            c_turn = round(cf[i] - ca[i], 4)
+
+            print(f"  iter {i}: "
+                  f"QPU[wait={q_wait}, svc={q_svc}, turn={q_turn}]  |  "
+                  f"CPU[wait={c_wait}, svc={c_svc}, turn={c_turn}]")
 
 
 def plot_all(job_records, display):
     print_phase_metrics(job_records, DISPLAY = display)
     plot_gantt(job_records, DISPLAY = display)
     
+def _as_times(values):
+    # float array of stamps; missing (None) stamps become NaN
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except TypeError:
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+def to_soa(job_records, keys):
+    """
+    Flatten per-job stamp lists into one column per key, one row per iteration.
+
+    Parameters:
+    - job_records: Dict of job_id -> record, as returned by JobRecordsManager.
+    - keys: Record keys to collect; each job contributes as many rows as its shortest list.
+
+    Returns:
+    - Dict of key -> float64 array (missing stamps as NaN), plus 'job_id' and 'iter_id' columns.
+    """
+    cols = {key: [] for key in keys}
+    job_ids, iter_ids = [], []
+    for job_id, row in job_records.items():
+        n, lists = _slices(row, keys)
+        for key, values in zip(keys, lists):
+            cols[key] += values
+        job_ids += [job_id] * n
+        iter_ids += range(n)
+
+    soa = {key: _as_times(values) for key, values in cols.items()}
+    soa["job_id"] = np.asarray(job_ids)
+    soa["iter_id"] = np.asarray(iter_ids, dtype=np.int64)
+    return soa
+
+def _durations(starts, finishes):
+    # finish - start per slice, 0 where a stamp is missing or the slice is inverted
+    s = _as_times(starts)
+    f = _as_times(finishes)
+    return np.where(f >= s, f - s, 0.0)
+
 def calculate_device_usage_units(job_records, sim_env):
 
     T = sim_env.now
@@ -129,62 +175,76 @@ def calculate_device_usage_units(job_records, sim_env):
     cpu_units_cap = sum(getattr(d, "container", None).capacity for d in getattr(sim_env, "cpu_devices", []) if getattr(d, "container", None))
     mem_bw_cap    = sum(getattr(d, "mem_bw",    None).capacity for d in getattr(sim_env, "cpu_devices", []) if getattr(d, "mem_bw", None))
 
-    qpu_units_time = 0.0
-    cpu_units_time = 0.0
-    mem_bw_time    = 0.0
+    # Flatten every slice across jobs, then weight durations in one array pass
+    q_s, q_f, q_u = [], [], []
+    c_s, c_f, c_u, c_b = [], [], [], []
 
     for _, rec in job_records.items():
-        qs = rec.get('qpu_start', []) or []
-        qf = rec.get('qpu_finish', []) or []
-        qu = rec.get('qpu_units', []) or []  # if you logged it; otherwise assume 1
+        qs = _safe_list(rec, 'qpu_start')
+        qf = _safe_list(rec, 'qpu_finish')
+        qu = _safe_list(rec, 'qpu_units')  # if you logged it; otherwise assume 1
 
-        cs = rec.get('cpu_start', []) or []
-        cf = rec.get('cpu_finish', []) or []
-        cu = rec.get('cpu_units', []) or []
-        mb = rec.get('cpu_mem_bw', []) or []
+        cs = _safe_list(rec, 'cpu_start')
+        cf = _safe_list(rec, 'cpu_finish')
+        cu = _safe_list(rec, 'cpu_units')
+        mb = _safe_list(rec, 'cpu_mem_bw')
 
         n_q = min(len(qs), len(qf), len(qu)) if qu else min(len(qs), len(qf))
         n_c = min(len(cs), len(cf), len(cu), len(mb)) if (cu and mb) else min(len(cs), len(cf))
 
         # QPU: treat each phase weight by qubits (if available) else 1
-        for i in range(n_q):
-            s, f = qs[i], qf[i]
-            units = (qu[i] if qu else 1)
-            if s is not None and f is not None and f >= s:
-                qpu_units_time += (f - s) * units
+        q_s += qs[:n_q]; q_f += qf[:n_q]
+        q_u += qu[:n_q] if qu else [1] * n_q
 
         # CPU: accumulate BOTH CPU-units*time and mem-bw*time
-        for i in range(n_c):
-            s, f = cs[i], cf[i]
-            cpu_units = (cu[i] if cu else 1)
-            mem_units = (mb[i] if mb else 1)
-            if s is not None and f is not None and f >= s:
-                dt = (f - s)
-                cpu_units_time += dt * cpu_units
-                mem_bw_time    += dt * mem_units
+        c_s += cs[:n_c]; c_f += cf[:n_c]
+        c_u += cu[:n_c] if cu else [1] * n_c
+        c_b += mb[:n_c] if mb else [1] * n_c
+
+    q_dt = _durations(q_s, q_f)
+    c_dt = _durations(c_s, c_f)
+    qpu_units_time = float(q_dt @ np.asarray(q_u, dtype=np.float64))
+    cpu_units_time = float(c_dt @ np.asarray(c_u, dtype=np.float64))
+    mem_bw_time    = float(c_dt @ np.asarray(c_b, dtype=np.float64))
 
     # Denominators
     qpu_den = max(1e-12, qpu_units_cap * T) if qpu_units_cap else 1e-12
     cpu_den = max(1e-12, cpu_units_cap * T) if cpu_units_cap else 1e-12
     mbw_den = max(1e-12, mem_bw_cap    * T) if mem_bw_cap    else 1e-12
 
+    # Full precision; plotters format to two decimals when drawing
     return {
-        "time": round(T, 2),
-        "qpu_util_percent": round(100.0 * qpu_units_time / qpu_den, 2) if qpu_units_cap else 0.0,
-        "cpu_util_percent": round(100.0 * cpu_units_time / cpu_den, 2) if cpu_units_cap else 0.0,
-        "mem_bw_util_percent": round(100.0 * mem_bw_time / mbw_den, 2) if mem_bw_cap else 0.0,
-        "qpu_units_time": round(qpu_units_time, 2),
-        "cpu_units_time": round(cpu_units_time, 2),
-        "mem_bw_time": round(mem_bw_time, 2),
+        "time": T,
+        "qpu_util_percent": 100.0 * qpu_units_time / qpu_den if qpu_units_cap else 0.0,
+        "cpu_util_percent": 100.0 * cpu_units_time / cpu_den if cpu_units_cap else 0.0,
+        "mem_bw_util_percent": 100.0 * mem_bw_time / mbw_den if mem_bw_cap else 0.0,
+        "qpu_units_time": qpu_units_time,
+        "cpu_units_time": cpu_units_time,
+        "mem_bw_time": mem_bw_time,
         "qpu_units_capacity": qpu_units_cap,
         "cpu_units_capacity": cpu_units_cap,
         "mem_bw_capacity": mem_bw_cap,
     }
 
+# (plotter, figsize) -> (fig, ax) kept for reuse while the figure is still open
+_FIG_CACHE = {}
+
+def _reuse_subplots(key, figsize):
+    # Reuse this plotter's figure if pyplot still manages it (inline backends close it on show)
+    cached = _FIG_CACHE.get((key, figsize))
+    if cached is not None and plt.fignum_exists(cached[0].number):
+        fig, ax = cached
+        plt.figure(fig.number)
+        ax.clear()
+        return fig, ax
+    fig, ax = plt.subplots(figsize=figsize)
+    _FIG_CACHE[(key, figsize)] = (fig, ax)
+    return fig, ax
+
 def plot_cpu_resource_util(util):
     labels = ["CPU units", "Memory BW"]
     vals = [util["cpu_util_percent"], util["mem_bw_util_percent"]]
-    fig, ax = plt.subplots(figsize=(6,4))
+    fig, ax = _reuse_subplots("cpu_resource_util", (6, 4))
     ax.bar(labels, vals)
     ax.set_ylim(0, 100)
     ax.set_ylabel("Utilization (%)", fontsize=12)
@@ -197,7 +257,7 @@ def plot_cpu_resource_util(util):
 def plot_processors_utilization(util):
     labels = ["QPU", "CPU"]
     values = [util["qpu_utilization_percent"], util["cpu_utilization_percent"]]
-    fig, ax = plt.subplots(figsize=(6,4))
+    fig, ax = _reuse_subplots("processors_utilization", (6, 4))
     ax.bar(labels, values)
     # ax.set_ylim(0, 100)
     ax.set_ylabel("Usage (%)", fontsize=12)
@@ -232,7 +292,7 @@ def plot_hybrid_utilization(util):
     vals = [max(0.0, min(100.0, v)) for v in [qpu, cpu, mbw]]
     labels = ["QPU", "CPU units", "Memory\nBandwidth"]
 
-    fig, ax = plt.subplots(figsize=(7.5, 4.5))
+    fig, ax = _reuse_subplots("hybrid_utilization", (7.5, 4.5))
 
     # pick custom colors & outline
     colors = ["#0496ff", "#f25c54", "#9c27b0"]
@@ -251,11 +311,33 @@ def plot_hybrid_utilization(util):
                 v,
                 f"{v:.2f}%",
                 ha="center", va="bottom", fontsize=17)
-    plt.ylim(0, 100)
+    ax.set_ylim(0, 100)
     fig.tight_layout()
     plt.show()
     
 
+def _busy_units(starts, finishes, units, ts):
+    """
+    Units in use at each timestamp, counting slices with start <= t < finish.
+
+    Parameters:
+    - starts, finishes: Slice start and finish times.
+    - units: Units held by each slice.
+    - ts: Sorted timestamps to evaluate.
+    """
+    starts = np.asarray(starts, dtype=np.float64)
+    finishes = np.asarray(finishes, dtype=np.float64)
+    units = np.asarray(units, dtype=np.int64).astype(np.float64)
+    live = finishes > starts  # empty or inverted slices are never active
+    starts, finishes, units = starts[live], finishes[live], units[live]
+
+    order_s = np.argsort(starts, kind='stable')
+    order_f = np.argsort(finishes, kind='stable')
+    started = np.concatenate(([0.0], np.cumsum(units[order_s])))
+    finished = np.concatenate(([0.0], np.cumsum(units[order_f])))
+    return (started[np.searchsorted(starts[order_s], ts, side='right')]
+            - finished[np.searchsorted(finishes[order_f], ts, side='right')])
+
 def utilization_time_series(job_records, 
                                   qpu_capacity_units,   # e.g., sum of QPU container.capacity across devices
                                   cpu_capacity_units,   # e.g., sum of CPU container.capacity across devices
@@ -268,77 +350,41 @@ def utilization_time_series(job_records,
       MemBW: sum of mem_bw-in-use / total MemBW units
     """
 
-    # 1) Determine total simulation horizon from last finish
-    max_t = 0.0
-    for rec in job_records.values():
-        if rec.get("qpu_finish"):
-            max_t = max(max_t, max(rec["qpu_finish"]))
-        if rec.get("cpu_finish"):
-            max_t = max(max_t, max(rec["cpu_finish"]))
+    # 1) Flatten every QPU/CPU slice into columns once; the horizon is the last finish logged
+    qpu = to_soa(job_records, ("qpu_start", "qpu_finish", "qpu_units"))
+    cpu = to_soa(job_records, ("cpu_start", "cpu_finish", "cpu_units", "cpu_mem_bw"))
+    max_t = float(max(np.nanmax(qpu["qpu_finish"], initial=0.0), np.nanmax(cpu["cpu_finish"], initial=0.0)))
     if max_t <= 0:
         return np.array([0.0]), [0.0], [0.0], [0.0]
 
     ts = np.arange(0.0, max_t + step, step)
 
-    qpu_util = []
-    cpu_util = []
-    mbw_util = []
-
-    # 2) Sample each timestamp
-    for t in ts:
-        qpu_busy_units = 0
-        cpu_busy_units = 0
-        mem_busy_units = 0
-
-        for rec in job_records.values():
-            # QPU: add qubits for each active QPU slice
-            q_s = rec.get("qpu_start", []) or []
-            q_f = rec.get("qpu_finish", []) or []
-            q_u = rec.get("qpu_units", []) or []
-            n_q = min(len(q_s), len(q_f), len(q_u))
-            for i in range(n_q):
-                s, f, u = q_s[i], q_f[i], int(q_u[i])
-                if s <= t < f:
-                    qpu_busy_units += u
-
-            # CPU: add cpu_units and mem_bw for each active CPU slice
-            c_s = rec.get("cpu_start", []) or []
-            c_f = rec.get("cpu_finish", []) or []
-            c_u = rec.get("cpu_units", []) or []
-            c_b = rec.get("cpu_mem_bw", []) or []
-            n_c = min(len(c_s), len(c_f), len(c_u), len(c_b))
-            for i in range(n_c):
-                s, f = c_s[i], c_f[i]
-                u = int(c_u[i])
-                bw = int(c_b[i])
-                if s <= t < f:
-                    cpu_busy_units += u
-                    mem_busy_units += bw
-
-        # 3) Convert to percentages against capacities
-        qpu_pct = 100.0 * qpu_busy_units / max(1e-12, qpu_capacity_units)
-        cpu_pct = 100.0 * cpu_busy_units / max(1e-12, cpu_capacity_units)
-        mbw_pct = 100.0 * mem_busy_units / max(1e-12, mem_bw_capacity_units)
-
-        # Clamp for display
-        qpu_util.append(max(0.0, min(100.0, qpu_pct)))
-        cpu_util.append(max(0.0, min(100.0, cpu_pct)))
-        mbw_util.append(max(0.0, min(100.0, mbw_pct)))
-
-    return ts, qpu_util, cpu_util, mbw_util
+    # 2) Sweep line: busy(t) = units started at or before t - units finished at or before t,
+    # which counts exactly the slices with s <= t < f
+    qpu_busy = _busy_units(qpu["qpu_start"], qpu["qpu_finish"], qpu["qpu_units"], ts)
+    cpu_busy = _busy_units(cpu["cpu_start"], cpu["cpu_finish"], cpu["cpu_units"], ts)
+    mem_busy = _busy_units(cpu["cpu_start"], cpu["cpu_finish"], cpu["cpu_mem_bw"], ts)
+
+    # 3) Convert to percentages against capacities, clamped for display
+    qpu_util = np.clip(100.0 * qpu_busy / max(1e-12, qpu_capacity_units), 0.0, 100.0)
+    cpu_util = np.clip(100.0 * cpu_busy / max(1e-12, cpu_capacity_units), 0.0, 100.0)
+    mbw_util = np.clip(100.0 * mem_busy / max(1e-12, mem_bw_capacity_units), 0.0, 100.0)
+
+    return ts, qpu_util.tolist(), cpu_util.tolist(), mbw_util.tolist()
 
 def plot_utilization_over_time(time_points, qpu_util, cpu_util, mem_util):
-    plt.figure(figsize=(10, 5))
-    plt.plot(time_points, qpu_util, label="QPU Utilization", color="#0496ff")
-    plt.plot(time_points, cpu_util, label="CPU Utilization", color="#f25c54")
-    plt.plot(time_points, mem_util, label="MemBW Utilization", color="#9c27b0")
-    plt.xlabel("Simulation Time", fontsize=20)
-    plt.ylabel("Utilization (%)", fontsize=20)
-    # plt.title("Resource Utilization Over Time")
-    # plt.ylim(0, 110)
-    plt.grid(True, linestyle=":")
-    plt.legend(fontsize=14)
-    plt.tight_layout()
-    plt.xticks(fontsize=18)
-    plt.yticks(fontsize=18)
-    plt.show()
\ No newline at end of file
+    # one float array per series (no-op for arrays already float64)
+    time_points = np.asarray(time_points, dtype=np.float64)
+    fig, ax = _reuse_subplots("utilization_over_time", (10, 5))
+    ax.plot(time_points, np.asarray(qpu_util, dtype=np.float64), label="QPU Utilization", color="#0496ff")
+    ax.plot(time_points, np.asarray(cpu_util, dtype=np.float64), label="CPU Utilization", color="#f25c54")
+    ax.plot(time_points, np.asarray(mem_util, dtype=np.float64), label="MemBW Utilization", color="#9c27b0")
+    ax.set_xlabel("Simulation Time", fontsize=20)
+    ax.set_ylabel("Utilization (%)", fontsize=20)
+    # ax.set_title("Resource Utilization Over Time")
+    # ax.set_ylim(0, 110)
+    ax.grid(True, linestyle=":")
+    ax.legend(fontsize=14)
+    fig.tight_layout()
+    ax.tick_params(axis='both', labelsize=18)
+    plt.show()
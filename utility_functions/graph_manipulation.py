@@ -1,10 +1,96 @@
-import threading
 import networkx as nx
-from itertools import combinations
+import numpy as np
+from collections import deque
 import math
 import random
 
-graph_lock = threading.Lock()
+# Node colors are stored per device as uint8 codes indexing COLOR_NAMES; code 0 marks a free qubit
+COLOR_NAMES = ('skyblue', 'red')
+SKYBLUE = 0
+
+def color_code_of(name):
+    """
+    Return the code of a color name.
+
+    Parameters:
+    name : str
+        The color name; must be one of COLOR_NAMES.
+
+    Returns:
+    int
+        The index of name in COLOR_NAMES.
+    """
+    try:
+        return COLOR_NAMES.index(name)
+    except ValueError:
+        raise ValueError(f"Unknown node color {name!r}. Choose from {list(COLOR_NAMES)}.") from None
+
+def connected_induced_subsets(neighbors, N, allowed):
+    """
+    Yield every connected set of N nodes drawn from allowed, each exactly once (ESU enumeration).
+    Each set is grown from its earliest node in allowed order, and a node only enters the
+    extension set through the first chosen node it neighbours, so no set is produced twice.
+
+    Parameters:
+    neighbors : dict
+        Mapping of node -> list of neighbouring nodes.
+    N : int
+        The number of nodes in each set.
+    allowed : list
+        The nodes that may be chosen, in the order used to break ties.
+
+    Yields:
+    list
+        The nodes of one connected set, in the order they were added.
+    """
+    rank = {n: i for i, n in enumerate(allowed)}
+
+    def extend(chosen, extension, closed, root):
+        if len(chosen) == N:
+            yield chosen
+            return
+        extension = list(extension)
+        while extension:
+            w = extension.pop()
+            new_nodes = [u for u in neighbors[w] if u not in closed and rank.get(u, -1) > root]
+            yield from extend(chosen + [w], extension + new_nodes, closed.union(new_nodes), root)
+
+    for v in allowed:
+        root = rank[v]
+        start = [u for u in neighbors[v] if rank.get(u, -1) > root]
+        yield from extend([v], start, set(start) | {v}, root)
+
+def num_cc_excluding(neighbors, nodes, excluded):
+    """
+    Count the connected components among nodes once the excluded nodes are masked out,
+    walking the adjacency directly instead of building a reduced copy of the graph.
+
+    Parameters:
+    neighbors : dict
+        Mapping of node -> list of neighbouring nodes.
+    nodes : iterable
+        The nodes to count over.
+    excluded : iterable
+        The nodes treated as removed.
+
+    Returns:
+    int
+        The number of connected components.
+    """
+    seen = set(excluded)
+    cc = 0
+    for s in nodes:
+        if s in seen:
+            continue
+        cc += 1
+        seen.add(s)
+        stack = [s]
+        while stack:
+            for v in neighbors[stack.pop()]:
+                if v not in seen:
+                    seen.add(v)
+                    stack.append(v)
+    return cc
 
 def select_vertices(device, N, name):
     """
@@ -24,34 +110,37 @@ def select_vertices(device, N, name):
         or None if no suitable combination is found.
     """
     graph = device.graph
-    color_map = device.color_map
-    min_subgraphs = float('inf')
+    best_key = None
     best_combination = None
     i = 0
-    with graph_lock:
-        
-        combin = math.comb(len(graph.nodes), N)       
-        
-#         print('combinations: ', combin)
-        
-        for combination in combinations(graph.nodes, N):
-            glist = list(graph.nodes)
-            skip = False
-
-            for c in combination: 
-                if color_map[glist.index(c)] != 'skyblue': 
-                    skip = True
-            if skip: 
-                continue
-            subgraph = graph.subgraph(combination)
-            if nx.is_connected(subgraph):
-                remaining_graph = graph.copy()
-                remaining_graph.remove_nodes_from(combination)
-                num_subgraphs = nx.number_connected_components(remaining_graph)
-                if num_subgraphs < min_subgraphs:
-                    min_subgraphs = num_subgraphs
-                    best_combination = combination
-            i += 1
+    # Only free ('skyblue') nodes can be selected, so enumerate combinations of those alone
+    node_list = list(graph)
+    blue = [node_list[k] for k in np.flatnonzero(device.color_code == SKYBLUE).tolist()]
+    if len(blue) < N:
+        return None
+    rank = {n: i for i, n in enumerate(blue)}
+    # A connected combination lies inside a single component, so only that component needs
+    # recounting after the removal; the labels are kept up to date across jobs on the device
+    components, comp_id = component_labels(device)
+    total = len(components)
+    # Removing a connected set can only lower the count when it is a whole component
+    lower_bound = total - 1 if any(len(nodes) == N for nodes in components.values()) else total
+
+    # Only connected sets are generated, so no per-combination connectivity test is needed
+    neighbors = device.prog_neighbors
+    for subset in connected_induced_subsets(neighbors, N, blue):
+        # Sets come grouped by their first node; once the best count reaches the lower bound,
+        # sets starting after the best one can only tie and lose the tie-break
+        if best_key is not None and best_key[0] <= lower_bound and rank[subset[0]] > best_key[1][0]:
+            break
+        combination = tuple(sorted(subset, key=rank.__getitem__))
+        num_subgraphs = total - 1 + num_cc_excluding(neighbors, components[comp_id[combination[0]]], combination)
+        # Ties go to the combination that comes first in combinations() order
+        key = (num_subgraphs, [rank[n] for n in combination])
+        if best_key is None or key < best_key:
+            best_key = key
+            best_combination = combination
+        i += 1
 
 #         print(f'Job #{name}. The best combination: {best_combination}')
 
@@ -65,6 +154,29 @@ Filter by the color map during traversal: Ensure that the vertices being conside
 
 """
 
+def _bfs_nodes(neighbors, source, allowed):
+    """
+    Yield the allowed nodes reachable from source through allowed nodes only, in breadth-first
+    order and excluding source itself. Nodes outside allowed are pruned when reached, so the
+    traversal never passes through them.
+
+    Parameters:
+    neighbors : dict
+        Mapping of node -> list of neighbouring nodes.
+    source : int
+        The node to start from.
+    allowed : set
+        The nodes the traversal may visit.
+    """
+    seen = {source}
+    queue = deque([source])
+    while queue:
+        for child in neighbors[queue.popleft()]:
+            if child not in seen and child in allowed:
+                seen.add(child)
+                queue.append(child)
+                yield child
+
 def select_vertices_fast(device, N, name):
     """
     Select a connected subgraph of N vertices from the graph based on the color map and connectivity.
@@ -82,27 +194,45 @@ def select_vertices_fast(device, N, name):
         A connected subgraph of N vertices that match the color criteria, or None if no suitable subgraph is found.
     """
     
+    # The result only depends on the graph state and N, so reuse it until the graph changes
+    cache = device._selection_cache
+    if N in cache:
+        cached = cache[N]
+        return None if cached is None else list(cached)
+    selected = _select_vertices_fast(device, N, name)
+    cache[N] = selected
+    return None if selected is None else list(selected)
+
+def _select_vertices_fast(device, N, name):
+    """
+    Uncached search behind select_vertices_fast; see there for the parameters.
+    """
     graph = device.graph
-    color_map = device.color_map
+    neighbors = device.prog_neighbors
     # Filter the nodes by color ('skyblue') and create a list of candidate nodes
-    candidate_nodes = [node for node in graph.nodes if color_map[list(graph.nodes).index(node)] == 'skyblue']
+    node_list = list(graph)
+    candidate_nodes = [node_list[k] for k in np.flatnonzero(device.color_code == SKYBLUE).tolist()]
 
     if len(candidate_nodes) < N:
 #         print(f"Not enough 'skyblue' nodes to form a subgraph of {N} nodes.")
         return None
 
-    # Try to find a connected subgraph of size N using BFS or DFS
+    candidate_set = set(candidate_nodes)
+    # Nodes of skyblue components already found to hold fewer than N nodes
+    exhausted = set()
+
+    # Try to find a connected subgraph of size N using BFS over 'skyblue' nodes only
     for start_node in candidate_nodes:
-        # Perform BFS or DFS starting from the current node
-        connected_nodes = list(nx.bfs_edges(graph, start_node))  # You could also use dfs_edges if preferred
+        if start_node in exhausted:
+            continue
+        # The traversal is consumed lazily and stops as soon as N nodes are collected
         subgraph_nodes = set([start_node])  # Start with the initial node
         
-        for edge in connected_nodes:
-            if len(subgraph_nodes) >= N:
-                break
-            # Add both nodes from the edge if they meet the 'skyblue' criteria
-            if edge[1] in candidate_nodes:
-                subgraph_nodes.add(edge[1])
+        if len(subgraph_nodes) < N:
+            for node in _bfs_nodes(neighbors, start_node, candidate_set):
+                subgraph_nodes.add(node)
+                if len(subgraph_nodes) == N:
+                    break
 
         # If we have a connected subgraph of N nodes, return it
         if len(subgraph_nodes) == N:
@@ -110,11 +240,89 @@ def select_vertices_fast(device, N, name):
 #             print(f'Job #{name}. The selected connected subgraph: {subgraph_nodes}')
 
             return list(subgraph_nodes)
+
+        # The whole component was traversed; no other start inside it can do better
+        exhausted.update(subgraph_nodes)
     
 #     print(f'Job #{name}. No connected subgraph of {N} vertices found.')
 
     return None
 
+def component_labels(device):
+    """
+    Return the connected-component labelling of the device graph, building it on first use.
+    Once built, remove_connectivity and reconnect_nodes keep it in step with the graph by
+    relabelling only the components their edge changes touch.
+
+    Parameters:
+    device : QuantumDevice 
+        qdevice whose graph is labelled.
+
+    Returns:
+    tuple
+        (components, comp_id): a dict of label -> set of nodes, and a dict of node -> label.
+    """
+    if device._components is None:
+        components = {}
+        comp_id = {}
+        for nodes in nx.connected_components(device.graph):
+            label = next(iter(nodes))
+            components[label] = nodes
+            for n in nodes:
+                comp_id[n] = label
+        device._components = (components, comp_id)
+    return device._components
+
+def _split_components(device, touched):
+    """
+    Relabel the components containing the touched nodes after edges between them were removed.
+
+    Parameters:
+    device : QuantumDevice 
+        qdevice whose labelling is updated.
+    touched : set
+        Endpoints of the removed edges.
+    """
+    components, comp_id = device._components
+    neighbors = device.prog_neighbors
+    for label in {comp_id[n] for n in touched}:
+        remaining = components.pop(label)
+        while remaining:
+            start = remaining.pop()
+            piece = {start}
+            stack = [start]
+            while stack:
+                for v in neighbors[stack.pop()]:
+                    if v not in piece:
+                        piece.add(v)
+                        stack.append(v)
+            remaining -= piece
+            components[start] = piece
+            for n in piece:
+                comp_id[n] = start
+
+def _merge_components(device, added_edges):
+    """
+    Merge the components joined by newly added edges, folding the smaller into the larger.
+
+    Parameters:
+    device : QuantumDevice 
+        qdevice whose labelling is updated.
+    added_edges : list
+        The edges that were added to the graph.
+    """
+    components, comp_id = device._components
+    for u, v in added_edges:
+        lu, lv = comp_id[u], comp_id[v]
+        if lu == lv:
+            continue
+        if len(components[lu]) < len(components[lv]):
+            lu, lv = lv, lu
+        absorbed = components.pop(lv)
+        components[lu] |= absorbed
+        for n in absorbed:
+            comp_id[n] = lu
+
 def remove_connectivity(device, nodes, new_color):
     """
     Remove the connectivity of the specified nodes from the graph and update their colors.
@@ -130,19 +338,27 @@ def remove_connectivity(device, nodes, new_color):
         A list of edges that were removed from the graph.
     """
     graph = device.graph
-    color_map = device.color_map
+    color_code = device.color_code
     
-    with graph_lock:
-        for i, node in enumerate(graph.nodes):
-            if node in nodes: 
-                color_map[i] = new_color
-
-        edges_to_remove = []
-        for node in nodes:
-            for neighbor in list(graph.neighbors(node)):
-                if neighbor not in nodes:
-                    edges_to_remove.append((node, neighbor))
-        graph.remove_edges_from(edges_to_remove)
+    code = color_code_of(new_color)
+    node_index = device.node_index
+    for node in nodes:
+        color_code[node_index[node]] = code
+
+    # Edges leaving the selection, read from the cached neighbour lists in one pass
+    prog_neighbors = device.prog_neighbors
+    nodes_set = set(nodes)
+    edges_to_remove = [(node, neighbor) for node in nodes for neighbor in prog_neighbors[node]
+                       if neighbor not in nodes_set]
+    graph.remove_edges_from(edges_to_remove)
+    device._selection_cache.clear()
+
+    # Refresh the cached neighbour lists of both ends of every removed edge
+    touched = {n for edge in edges_to_remove for n in edge}
+    for node in touched:
+        prog_neighbors[node] = list(graph.neighbors(node))
+    if device._components is not None:
+        _split_components(device, touched)
     return edges_to_remove
 
 def reconnect_nodes(device, selected_vertices):
@@ -163,22 +379,25 @@ def reconnect_nodes(device, selected_vertices):
     None
     """
     graph = device.graph
-    color_map = device.color_map
+    color_code = device.color_code
     edges = device.nodes
     
-    with graph_lock:
-        for i, node in enumerate(graph.nodes):
-            if node in selected_vertices: 
-                color_map[i] = 'skyblue'
-
-        edges_to_reconnect = []    
-        glist = list(graph.nodes)
-        for e in edges:         
-            node1 = e[0]       
-            node2 = e[1]
-            idx1 = glist.index(node1)
-            idx2 = glist.index(node2)
-            if color_map[idx1] == 'skyblue' and color_map[idx2] == 'skyblue': 
-                edges_to_reconnect.append(e)
-
-        graph.add_edges_from(edges_to_reconnect)
+    node_index = device.node_index
+    for node in selected_vertices:
+        color_code[node_index[node]] = SKYBLUE
+
+    # Topology edges whose endpoints are both 'skyblue'
+    skyblue = color_code == SKYBLUE
+    keep = skyblue[device.edges_u] & skyblue[device.edges_v]
+    edges_to_reconnect = [edges[i] for i in np.flatnonzero(keep)]
+
+    added_edges = [e for e in edges_to_reconnect if not graph.has_edge(e[0], e[1])]
+    graph.add_edges_from(edges_to_reconnect)
+    device._selection_cache.clear()
+
+    # Refresh the cached neighbour lists of both ends of every edge that was missing
+    prog_neighbors = device.prog_neighbors
+    for node in {n for edge in added_edges for n in edge}:
+        prog_neighbors[node] = list(graph.neighbors(node))
+    if device._components is not None:
+        _merge_components(device, added_edges)
@@ -1,7 +1,24 @@
 # utility_functions/graph_viz.py
 
 import networkx as nx
+import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+
+def _node_xy(QDevice):
+    """
+    Node positions of the device as an (n, 2) array in graph node order, computed once per device.
+
+    Parameters:
+    QDevice : object
+        The quantum device object containing topology information.
+    """
+    xy = getattr(QDevice, '_xy', None)
+    if xy is None:
+        pos = QDevice.pos
+        xy = np.array([pos[n] for n in QDevice.graph.nodes], dtype=float).reshape(-1, 2)
+        QDevice._xy = xy
+    return xy
 
 def display_graph(QDevice, figsize=(5, 3), title = '', node_size=700, font_size=8, with_labels=True):
     """
@@ -16,8 +33,23 @@ def display_graph(QDevice, figsize=(5, 3), title = '', node_size=700, font_size=
     complete_title = f'{QDevice.name} - {QDevice.number_of_qubits} qubits'
     if title != '': 
         complete_title += f'\n{title}'
+
+    graph = QDevice.graph
+    xy = _node_xy(QDevice)
+    node_index = QDevice.node_index
+    # All edges and all nodes are drawn as one collection each
+    ends = np.array([(node_index[u], node_index[v]) for u, v in graph.edges], dtype=np.intp).reshape(-1, 2)
     
     plt.figure(figsize=figsize)
-    nx.draw_networkx(QDevice.graph, QDevice.pos, node_color=QDevice.color_map, with_labels=with_labels, node_size=node_size, font_size=font_size)
+    ax = plt.gca()
+    ax.add_collection(LineCollection(xy[ends], colors='k', linewidths=1.0, zorder=1))
+    ax.scatter(xy[:, 0], xy[:, 1], c=QDevice.color_map, s=node_size, zorder=2)
+    if with_labels:
+        nx.draw_networkx_labels(graph, QDevice.pos, font_size=font_size, ax=ax)
+    ax.tick_params(axis='both', which='both', bottom=False, left=False, labelbottom=False, labelleft=False)
+    # Pad the limits by 5% of the span so markers at the border are not clipped, as draw_networkx does
+    pad = 0.05 * np.ptp(xy, axis=0)
+    ax.update_datalim([xy.min(axis=0) - pad, xy.max(axis=0) + pad])
+    ax.autoscale_view()
     plt.title(complete_title)
     plt.show()
\ No newline at end of file
@@ -1,5 +1,6 @@
 # plotting.py
 import matplotlib.pyplot as plt
+import numpy as np
 
 def plot_time_line(jobs, title, font_size=12, figsize=(6, 3)):
     """
@@ -19,13 +20,14 @@ def plot_time_line(jobs, title, font_size=12, figsize=(6, 3)):
     jobs = {'Job1': [1, 4], 'Job2': [2, 6], 'Job3': [5, 9]}
     plot_time_line(jobs, 'Job Timeline')
     """
-    # Extract job IDs, start times, and end times
+    # Extract job IDs, and start and end times into one (n, 2) array
     job_ids = list(jobs.keys())
-    start_times = [jobs[job][0] for job in job_ids]
-    end_times = [jobs[job][1] for job in job_ids]
+    times = np.fromiter((t for job in job_ids for t in jobs[job][:2]),
+                        dtype=np.float64, count=2 * len(job_ids)).reshape(-1, 2)
+    start_times = times[:, 0]
 
     # Calculate durations
-    durations = [end - start for start, end in zip(start_times, end_times)]
+    durations = times[:, 1] - start_times
 
     # Plot
     plt.figure(figsize=figsize)
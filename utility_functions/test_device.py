@@ -13,11 +13,10 @@ from devices import QuantumDevice, IBM_guadalupe, IBM_tokyo  # Import your quant
 def has_reversed_pair(data):
     pairs_set = set()
     
-    for pair in data:
-        p = tuple(pair)
-        if (p[1], p[0]) in pairs_set:
+    for a, b in data:
+        if (b, a) in pairs_set:
             return True  # Reversed pair found
-        pairs_set.add(p)
+        pairs_set.add((a, b))
     
     return False  # No reversed pair found
 
@@ -29,33 +28,35 @@ class TestHasReversedPairDynamic(unittest.TestCase):
         """Set up the quantum device dynamically."""
         env = simpy.Environment()  # Create the simpy environment
         cls.device_class = cls.device_class(env)  # Instantiate the device dynamically
+        # The device's edge list is read and checked once for the whole class
+        cls.cached_nodes = tuple(cls.device_class.nodes)
+        cls.device_has_reversed_pair = has_reversed_pair(cls.cached_nodes)
 
 
-    def test_reversed_pair_exists(self):
-        """Test case where a reversed pair exists in the quantum device's nodes."""
+    def test_no_reversed_pair(self):
+        """Test that the quantum device's nodes contain no reversed pair."""
         print(f"testing {self.device_class.name}")
-        data = self.device_class.nodes
-        self.assertFalse(has_reversed_pair(data), "Should return True when reversed pair exists")
+        self.assertFalse(self.device_has_reversed_pair, "Should return False when no reversed pair exists")
 
-    def test_no_reversed_pair(self):
-        """Test case where no reversed pair exists in the quantum device's nodes."""
-        data = self.device_class.nodes
-        self.assertFalse(has_reversed_pair(data), "Should return False when no reversed pair exists")
+    def test_reversed_pair_exists(self):
+        """Test case where a reversed pair exists in the data."""
+        a, b = self.cached_nodes[0]
+        data = self.cached_nodes + ((b, a),)
+        self.assertTrue(has_reversed_pair(data), "Should return True when reversed pair exists")
 
     def test_empty_data(self):
         """Test case where the data is empty."""
-        data = self.device_class.nodes
-        self.assertFalse(has_reversed_pair(data), "Should return False for empty data")
+        self.assertFalse(has_reversed_pair(()), "Should return False for empty data")
 
     def test_single_pair(self):
         """Test case where only one pair is present."""
-        data = self.device_class.nodes
+        data = self.cached_nodes[:1]
         self.assertFalse(has_reversed_pair(data), "Should return False for single pair")
 
     def test_multiple_reversed_pairs(self):
         """Test case where there are multiple reversed pairs in the data."""
-        data = self.device_class.nodes
-        self.assertFalse(has_reversed_pair(data), "Should return True when multiple reversed pairs exist")
+        data = self.cached_nodes[:3] + tuple((b, a) for a, b in self.cached_nodes[:3])
+        self.assertTrue(has_reversed_pair(data), "Should return True when multiple reversed pairs exist")
 
 
 def run_tests_with_device_class(device_class):